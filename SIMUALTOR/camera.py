@@ -0,0 +1,94 @@
+import math
+
+import numpy as np
+
+GRID_CELL = 64  # 공간 격자 한 칸 크기 (월드 단위)
+
+
+# --- 카메라 ---
+class Camera:
+    """월드 좌표 <-> 화면 좌표 변환
+
+    (x, y)는 뷰포트 왼쪽 위가 보고 있는 월드 좌표, zoom은 월드 1 단위당 픽셀 수.
+    """
+
+    def __init__(self, view_width, view_height, x=0.0, y=0.0, zoom=1.0,
+                 min_zoom=0.02, max_zoom=8.0):
+        self.view_width = view_width
+        self.view_height = view_height
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+
+    def world_to_screen(self, wx, wy):
+        return (wx - self.x) * self.zoom, (wy - self.y) * self.zoom
+
+    def screen_to_world(self, sx, sy):
+        return self.x + sx / self.zoom, self.y + sy / self.zoom
+
+    def pan(self, dx, dy):
+        """화면 픽셀 단위로 이동 (드래그한 방향으로 세상이 따라옴)"""
+        self.x -= dx / self.zoom
+        self.y -= dy / self.zoom
+
+    def zoom_at(self, sx, sy, factor):
+        """화면의 (sx, sy) 지점을 고정한 채로 확대/축소"""
+        wx, wy = self.screen_to_world(sx, sy)
+        self.zoom = max(self.min_zoom, min(self.max_zoom, self.zoom * factor))
+        self.x = wx - sx / self.zoom
+        self.y = wy - sy / self.zoom
+
+    def fit(self, width, height):
+        """월드 전체(width × height)가 뷰포트에 들어오게 맞춤"""
+        self.zoom = max(self.min_zoom, min(self.view_width / width, self.view_height / height))
+        self.x = (width - self.view_width / self.zoom) / 2
+        self.y = (height - self.view_height / self.zoom) / 2
+
+    def visible_rect(self):
+        """지금 보이는 월드 영역 (x0, y0, x1, y1)"""
+        return (self.x, self.y,
+                self.x + self.view_width / self.zoom, self.y + self.view_height / self.zoom)
+
+
+# --- 공간 격자 (그리기 컬링용) ---
+class SpatialGrid:
+    """원 중심을 균일 격자 칸별로 정렬해 둔 인덱스
+
+    칸 번호가 행 우선이라 한 행 안의 연속된 칸들은 order 배열에서도 연속된
+    구간이 된다. 그래서 사각형 질의는 보이는 행마다 슬라이스 하나로 끝나고,
+    비용이 전체 원 개수가 아니라 보이는 영역에 비례한다.
+    """
+
+    def __init__(self, xs, ys, width, height, cell=GRID_CELL):
+        self.cell = cell
+        self.cols = max(1, int(math.ceil(width / cell)))
+        self.rows = max(1, int(math.ceil(height / cell)))
+        cx = np.clip((xs // cell).astype(np.int64), 0, self.cols - 1)
+        cy = np.clip((ys // cell).astype(np.int64), 0, self.rows - 1)
+        cell_ids = cy * self.cols + cx
+        self.order = np.argsort(cell_ids, kind="stable")
+        self.counts = np.bincount(cell_ids, minlength=self.rows * self.cols)
+        self.starts = np.concatenate(([0], np.cumsum(self.counts)))
+
+    def _cell_range(self, x0, y0, x1, y1):
+        c0 = min(max(int(x0 // self.cell), 0), self.cols - 1)
+        c1 = min(max(int(x1 // self.cell), 0), self.cols - 1)
+        r0 = min(max(int(y0 // self.cell), 0), self.rows - 1)
+        r1 = min(max(int(y1 // self.cell), 0), self.rows - 1)
+        return c0, c1, r0, r1
+
+    def query(self, x0, y0, x1, y1):
+        """중심이 사각형 주변 칸에 있는 원들의 번호 (반지름만큼 넓혀서 부를 것)"""
+        c0, c1, r0, r1 = self._cell_range(x0, y0, x1, y1)
+        parts = [self.order[self.starts[row * self.cols + c0]:self.starts[row * self.cols + c1 + 1]]
+                 for row in range(r0, r1 + 1)]
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def density(self, x0, y0, x1, y1):
+        """사각형이 걸친 칸들의 원 개수 배열 (행, 열)과 그 블록의 월드 영역"""
+        c0, c1, r0, r1 = self._cell_range(x0, y0, x1, y1)
+        block = self.counts.reshape(self.rows, self.cols)[r0:r1 + 1, c0:c1 + 1]
+        bounds = (c0 * self.cell, r0 * self.cell, (c1 + 1) * self.cell, (r1 + 1) * self.cell)
+        return block, bounds
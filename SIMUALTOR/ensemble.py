@@ -0,0 +1,171 @@
+"""같은 기체 장면을 시드만 바꿔 여러 번 돌려서 통계를 모으는 앙상블 실행기
+
+main.py와 같은 물리(world.py, 완전 탄성 충돌)를 창 없이 프로세스 풀에서 돌린다.
+각 작업자는 전체 상태 대신 속력 히스토그램과 모멘트만 돌려주고,
+완료된 멤버마다 체크포인트를 저장해서 중간에 끊겨도 이어서 돌릴 수 있다.
+
+    python ensemble.py --members 64 --workers 8 --checkpoint gas.npz
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+
+from spawner import spawn_bodies
+from world import GameObject, WORLD_WIDTH, WORLD_HEIGHT, step_world
+
+SPEED_BINS = 60
+MOMENTS = ("count", "sum_v", "sum_v2", "sum_v4")
+
+
+def member_seed(base_seed, index):
+    """멤버마다 서로 겹치지 않는 재현 가능한 시드"""
+    return int(np.random.SeedSequence([base_seed, index]).generate_state(1)[0])
+
+
+def run_member(task):
+    """기체 장면 하나를 돌리고 (번호, 속력 히스토그램, 모멘트)를 돌려줌
+
+    모든 원이 같은 속력 speed로 무작위 방향으로 출발한다. 탄성 충돌이 충분히
+    일어나면 속력 분포가 2차원 맥스웰-볼츠만(레일리) 분포로 수렴한다.
+    마지막 sample_steps 동안 sample_every 스텝마다 속력을 히스토그램에 쌓는다.
+    """
+    index, seed, params = task
+    rng = np.random.default_rng(seed)
+    batch = spawn_bodies(params["bodies"], (0, 0, WORLD_WIDTH, WORLD_HEIGHT),
+                         radius=params["radius"], mass=1.0, seed=rng.integers(2**32))
+    angles = rng.uniform(0, 2 * math.pi, params["bodies"])
+    objects = []
+    for x, y, r, angle in zip(batch.x.tolist(), batch.y.tolist(), batch.radius.tolist(), angles.tolist()):
+        obj = GameObject(x, y, r, (0, 0, 0), mass=1.0)
+        obj.velocity.update(params["speed"] * math.cos(angle), params["speed"] * math.sin(angle))
+        objects.append(obj)
+
+    edges = speed_edges(params)
+    histogram = np.zeros(SPEED_BINS, dtype=np.int64)
+    moments = np.zeros(len(MOMENTS))
+    dt = 1.0 / params["hz"]
+    sample_from = params["steps"] - params["sample_steps"]
+    for step in range(params["steps"]):
+        step_world(objects, dt)
+        if step >= sample_from and (step - sample_from) % params["sample_every"] == 0:
+            speeds = np.hypot([o.velocity.x for o in objects], [o.velocity.y for o in objects])
+            histogram += np.histogram(speeds, bins=edges)[0]
+            v2 = speeds * speeds
+            moments += (len(speeds), speeds.sum(), v2.sum(), (v2 * v2).sum())
+    return index, histogram, moments
+
+
+def speed_edges(params):
+    return np.linspace(0, 4 * params["speed"], SPEED_BINS + 1)
+
+
+class EnsembleCheckpoint:
+    """완료된 멤버 목록과 누적 히스토그램/모멘트를 .npz 파일에 저장"""
+
+    def __init__(self, path, params):
+        self.path = path
+        # 멤버 수는 빼고 비교해서 같은 설정의 앙상블을 나중에 더 늘릴 수 있게 함
+        self.params = {key: value for key, value in params.items() if key != "members"}
+        self.done = set()
+        self.histogram = np.zeros(SPEED_BINS, dtype=np.int64)
+        self.moments = np.zeros(len(MOMENTS))
+        if path and os.path.exists(path):
+            self._load()
+
+    def _load(self):
+        with np.load(self.path) as data:
+            saved = json.loads(str(data["params"]))
+            if saved != self.params:
+                raise ValueError(f"{self.path} was written with different parameters: {saved}")
+            self.done = set(data["done"].tolist())
+            self.histogram = data["histogram"]
+            self.moments = data["moments"]
+
+    def add(self, index, histogram, moments):
+        self.done.add(index)
+        self.histogram = self.histogram + histogram
+        self.moments = self.moments + moments
+
+    def save(self):
+        if not self.path:
+            return
+        # 임시 파일에 쓰고 바꿔 끼워서 저장 중에 끊겨도 이전 체크포인트가 남게 함
+        temp = self.path + ".tmp.npz"
+        np.savez(temp, params=json.dumps(self.params), done=np.array(sorted(self.done), dtype=np.int64),
+                 histogram=self.histogram, moments=self.moments)
+        os.replace(temp, self.path)
+
+
+def run_ensemble(params, workers=None, checkpoint_path=None, progress=None):
+    """params["members"]개 멤버를 프로세스 풀에서 돌리고 누적 결과(EnsembleCheckpoint)를 돌려줌"""
+    state = EnsembleCheckpoint(checkpoint_path, params)
+    tasks = [(i, member_seed(params["seed"], i), params)
+             for i in range(params["members"]) if i not in state.done]
+    if tasks:
+        with multiprocessing.Pool(workers) as pool:
+            for index, histogram, moments in pool.imap_unordered(run_member, tasks):
+                state.add(index, histogram, moments)
+                state.save()
+                if progress:
+                    progress(len(state.done), params["members"])
+    return state
+
+
+def summarize(state, params):
+    """누적 결과를 레일리 분포(2차원 맥스웰-볼츠만)와 비교한 요약"""
+    count, sum_v, sum_v2, sum_v4 = state.moments
+    if count == 0:
+        return {}
+    edges = speed_edges(params)
+    centers = (edges[:-1] + edges[1:]) / 2
+    width = edges[1] - edges[0]
+    sigma_sq = sum_v2 / count / 2  # 2차원에서 <v²> = 2σ²
+    expected = centers / sigma_sq * np.exp(-centers * centers / (2 * sigma_sq)) * width
+    observed = state.histogram / max(state.histogram.sum(), 1)
+    return {
+        "members": len(state.done),
+        "samples": int(count),
+        "mean_speed": sum_v / count,
+        "rms_speed": math.sqrt(sum_v2 / count),
+        "rayleigh_mean_speed": math.sqrt(math.pi * sigma_sq / 2),
+        # 레일리 분포면 <v⁴>/<v²>² = 2
+        "v4_ratio": (sum_v4 / count) / (sum_v2 / count) ** 2,
+        "l1_to_rayleigh": float(np.abs(observed - expected).sum()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SIMUALTOR 기체 장면 몬테카를로 앙상블")
+    parser.add_argument("--members", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=None, help="기본값: CPU 코어 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bodies", type=int, default=150)
+    parser.add_argument("--radius", type=float, default=40)
+    parser.add_argument("--speed", type=float, default=200)
+    parser.add_argument("--hz", type=int, default=120)
+    parser.add_argument("--steps", type=int, default=3600)
+    parser.add_argument("--sample-steps", type=int, default=1200)
+    parser.add_argument("--sample-every", type=int, default=30)
+    parser.add_argument("--checkpoint", default=None, help="체크포인트 .npz 경로 (있으면 이어서 실행)")
+    parser.add_argument("--output", default=None, help="최종 히스토그램을 저장할 .npz 경로")
+    args = parser.parse_args()
+
+    params = {name: getattr(args, name) for name in
+              ("members", "seed", "bodies", "radius", "speed", "hz", "steps", "sample_steps", "sample_every")}
+    state = run_ensemble(params, args.workers, args.checkpoint,
+                         progress=lambda done, total: print(f"{done}/{total} 완료", flush=True))
+
+    for key, value in summarize(state, params).items():
+        print(f"{key}: {value}")
+    if args.output:
+        np.savez(args.output, edges=speed_edges(params), histogram=state.histogram, moments=state.moments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+import json
+import math
+
+import numpy as np
+
+LEAF_SIZE = 4  # BVH 잎 노드 하나에 들어가는 최대 선분 수
+
+
+def load_level(path):
+    """레벨 파일(JSON)을 읽어서 StaticLevel로 만듦
+
+    형식: {"segments": [[x1, y1, x2, y2], ...],
+           "polygons": [[[x, y], [x, y], ...], ...]}
+    다각형은 닫힌 선분들로 바뀐다 (마지막 점 -> 첫 점 포함).
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    segments = [tuple(float(v) for v in seg) for seg in data.get("segments", [])]
+    polygons = [[(float(x), float(y)) for x, y in poly] for poly in data.get("polygons", [])]
+    for poly in polygons:
+        for i in range(len(poly)):
+            (x1, y1), (x2, y2) = poly[i], poly[(i + 1) % len(poly)]
+            segments.append((x1, y1, x2, y2))
+    return StaticLevel(segments, polygons)
+
+
+def point_in_polygon(x, y, poly):
+    """점이 다각형 안에 있는지 (오른쪽으로 쏜 반직선이 변을 홀수 번 지나면 안쪽)"""
+    inside = False
+    for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+        if (ay > y) != (by > y) and x < ax + (y - ay) * (bx - ax) / (by - ay):
+            inside = not inside
+    return inside
+
+
+def closest_point_on_segment(x, y, x1, y1, x2, y2):
+    """선분 위에서 점 (x, y)와 가장 가까운 점"""
+    sx, sy = x2 - x1, y2 - y1
+    length_sq = sx * sx + sy * sy
+    t = 0.0 if length_sq == 0 else max(0.0, min(1.0, ((x - x1) * sx + (y - y1) * sy) / length_sq))
+    return x1 + t * sx, y1 + t * sy
+
+
+class StaticLevel:
+    """움직이지 않는 선분 충돌체 + 한 번만 만드는 BVH
+
+    원이 매 스텝 BVH에 질의해서 근처 선분하고만 충돌 검사를 하므로
+    정적 지형은 원끼리의 충돌 검사(쌍 루프)에 전혀 끼지 않는다.
+    다각형은 속이 찬 것으로 본다: 중심이 다각형 안에 들어간 원은 가장
+    가까운 변 밖으로 밀려난다. 안쪽 판정도 BVH로 찾은 근처 선분이 변인
+    다각형만 하므로, 다각형의 변들도 segments에 들어 있어야 한다
+    (load_level이 그렇게 만든다). 한 스텝에 반지름보다 덜 움직이는 원은
+    변을 넘는 순간 반지름 안에 그 변이 있어서 항상 잡힌다.
+    """
+
+    def __init__(self, segments, polygons=()):
+        self.segments = list(segments)
+        self.polygons = [list(poly) for poly in polygons]  # 원본 다각형 (그리기, 안쪽 판정용)
+        self.polygon_bounds = [(min(x for x, _ in poly), min(y for _, y in poly),
+                                max(x for x, _ in poly), max(y for _, y in poly))
+                               for poly in self.polygons]
+        self.edge_polygons = {}  # 변 선분 -> 그 변을 가진 다각형 번호들
+        for i, poly in enumerate(self.polygons):
+            for (x1, y1), (x2, y2) in zip(poly, poly[1:] + poly[:1]):
+                self.edge_polygons.setdefault((x1, y1, x2, y2), []).append(i)
+        # 노드 배열: 경계 상자, 자식 번호(-1이면 잎), 잎이 가진 선분 구간
+        self.min_x, self.min_y, self.max_x, self.max_y = [], [], [], []
+        self.left, self.right, self.start, self.count = [], [], [], []
+        if self.segments:
+            self.segments = self._build(self.segments)
+
+    def _add_node(self, segs):
+        self.min_x.append(min(min(s[0], s[2]) for s in segs))
+        self.min_y.append(min(min(s[1], s[3]) for s in segs))
+        self.max_x.append(max(max(s[0], s[2]) for s in segs))
+        self.max_y.append(max(max(s[1], s[3]) for s in segs))
+        self.left.append(-1)
+        self.right.append(-1)
+        self.start.append(0)
+        self.count.append(0)
+        return len(self.left) - 1
+
+    def _build(self, segments):
+        """긴 축의 중앙값으로 나누는 BVH, 선분 리스트는 잎 순서대로 재배열해서 돌려줌"""
+        ordered = []
+        stack = [(self._add_node(segments), segments)]
+        while stack:
+            node, segs = stack.pop()
+            if len(segs) <= LEAF_SIZE:
+                self.start[node] = len(ordered)
+                self.count[node] = len(segs)
+                ordered.extend(segs)
+                continue
+            # 경계 상자의 긴 축 기준으로 선분 중점을 정렬해서 반으로 나눔
+            if self.max_x[node] - self.min_x[node] >= self.max_y[node] - self.min_y[node]:
+                segs = sorted(segs, key=lambda s: s[0] + s[2])
+            else:
+                segs = sorted(segs, key=lambda s: s[1] + s[3])
+            half = len(segs) // 2
+            left, right = segs[:half], segs[half:]
+            self.left[node] = self._add_node(left)
+            self.right[node] = self._add_node(right)
+            stack.append((self.left[node], left))
+            stack.append((self.right[node], right))
+        return ordered
+
+    def query(self, x0, y0, x1, y1):
+        """경계 상자가 사각형과 겹치는 선분들"""
+        found = []
+        if not self.segments:
+            return found
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if (self.max_x[node] < x0 or self.min_x[node] > x1
+                    or self.max_y[node] < y0 or self.min_y[node] > y1):
+                continue
+            if self.left[node] < 0:
+                found.extend(self.segments[self.start[node]:self.start[node] + self.count[node]])
+            else:
+                stack.append(self.left[node])
+                stack.append(self.right[node])
+        return found
+
+    def inside_polygon(self, x, y, nearby):
+        """nearby 선분(query 결과)을 변으로 가진 다각형 중 점을 품은 것, 없으면 None"""
+        checked = set()
+        for seg in nearby:
+            for i in self.edge_polygons.get(seg, ()):
+                if i in checked:
+                    continue
+                checked.add(i)
+                px0, py0, px1, py1 = self.polygon_bounds[i]
+                if px0 <= x <= px1 and py0 <= y <= py1 and point_in_polygon(x, y, self.polygons[i]):
+                    return self.polygons[i]
+        return None
+
+    def blocked(self, xs, ys, rs):
+        """원 배열 (xs, ys, rs) 중 선분과 겹치거나 중심이 다각형 안에 있는 것 (bool 배열)"""
+        xs, ys, rs = (np.asarray(a, dtype=float) for a in (xs, ys, rs))
+        hit = np.zeros(len(xs), dtype=bool)
+        if len(xs) == 0:
+            return hit
+        r_max = rs.max()
+        for x1, y1, x2, y2 in self.query(xs.min() - r_max, ys.min() - r_max,
+                                         xs.max() + r_max, ys.max() + r_max):
+            sx, sy = x2 - x1, y2 - y1
+            length_sq = sx * sx + sy * sy
+            if length_sq == 0:
+                t = np.zeros(len(xs))
+            else:
+                t = np.clip(((xs - x1) * sx + (ys - y1) * sy) / length_sq, 0, 1)
+            dx = xs - (x1 + t * sx)
+            dy = ys - (y1 + t * sy)
+            hit |= dx * dx + dy * dy < rs * rs
+        for poly in self.polygons:
+            # 같은 반직선 판정을 후보 전체에 한 번에
+            inside = np.zeros(len(xs), dtype=bool)
+            for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+                crosses = (ay > ys) != (by > ys)
+                idx = np.flatnonzero(crosses)
+                inside[idx] ^= xs[idx] < ax + (ys[idx] - ay) * (bx - ax) / (by - ay)
+            hit |= inside
+        return hit
+
+    def collide(self, obj, restitution=1.0, impulse=None):
+        """원(GameObject)을 근처 선분들과 충돌 처리 (겹침 분리 + 법선 방향 반사)
+
+        impulse: [x, y] 리스트를 주면 지형이 원에 준 충격량을 더함
+        """
+        x, y, r = obj.pos.x, obj.pos.y, obj.radius
+        nearby = self.query(x - r, y - r, x + r, y + r)
+
+        # 중심이 다각형 안으로 들어갔으면 가장 가까운 변 밖으로 꺼냄
+        poly = self.inside_polygon(x, y, nearby) if nearby and self.edge_polygons else None
+        if poly is not None:
+            best = None
+            for (ax, ay), (bx, by) in zip(poly, poly[1:] + poly[:1]):
+                cx, cy = closest_point_on_segment(x, y, ax, ay, bx, by)
+                distance_sq = (cx - x) * (cx - x) + (cy - y) * (cy - y)
+                if best is None or distance_sq < best[0]:
+                    best = (distance_sq, cx, cy)
+            distance_sq, cx, cy = best
+            distance = math.sqrt(distance_sq)
+            if distance > 0:
+                normal_x, normal_y = (cx - x) / distance, (cy - y) / distance  # 바깥쪽
+                x, y = cx + normal_x * r, cy + normal_y * r
+                self._reflect(obj, normal_x, normal_y, restitution, impulse)
+                nearby = self.query(x - r, y - r, x + r, y + r)  # 옮긴 자리 주변 선분
+
+        for x1, y1, x2, y2 in nearby:
+            # 선분 위에서 원의 중심과 가장 가까운 점
+            cx, cy = closest_point_on_segment(x, y, x1, y1, x2, y2)
+            dx = x - cx
+            dy = y - cy
+            distance = math.sqrt(dx * dx + dy * dy)
+            if distance >= r or distance == 0:
+                continue
+
+            # 겹친 만큼 선분 밖으로 밀어냄
+            normal_x, normal_y = dx / distance, dy / distance
+            x += normal_x * (r - distance)
+            y += normal_y * (r - distance)
+            self._reflect(obj, normal_x, normal_y, restitution, impulse)
+        obj.pos.x, obj.pos.y = x, y
+
+    @staticmethod
+    def _reflect(obj, normal_x, normal_y, restitution, impulse):
+        """법선 반대쪽으로 움직이고 있으면 법선 방향 속도만 반사"""
+        velocity_along_normal = obj.velocity.x * normal_x + obj.velocity.y * normal_y
+        if velocity_along_normal < 0:
+            if impulse is not None:
+                impulse[0] -= obj.mass * (1 + restitution) * velocity_along_normal * normal_x
+                impulse[1] -= obj.mass * (1 + restitution) * velocity_along_normal * normal_y
+            obj.velocity.x -= (1 + restitution) * velocity_along_normal * normal_x
+            obj.velocity.y -= (1 + restitution) * velocity_along_normal * normal_y
@@ -1,11 +1,25 @@
 import pygame
 import math
 import random
+import sys
+import threading
+import time
+
+import numpy as np
+
+from camera import Camera
+from level import load_level
+from spawner import spawn_bodies
+from telemetry import KINETIC_ENERGY, export_rows
+from world import GameObject, PhysicsWorker, WORLD_WIDTH, WORLD_HEIGHT
 
 # --- 상수 ---
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
+VIEW_HEIGHT = SCREEN_HEIGHT - 150  # 아래쪽 UI 패널을 뺀 월드가 보이는 영역
 FPS = 60
+DENSITY_ZOOM = 0.2  # 이보다 많이 축소하면 원 대신 밀도 지도로 그림
+MAX_DRAWN_BODIES = 20000  # 보이는 원이 이보다 많아도 밀도 지도로 그림
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -18,6 +32,11 @@ YELLOW = (255, 255, 0)
 PURPLE = (128, 0, 128)
 ORANGE = (255, 165, 0)
 
+BULK_SPAWN_COUNT = 50  # (B) 키 한 번에 추가되는 원 개수
+BULK_SPAWN_RADIUS = (8, 15)
+BULK_SPAWN_MASS = (0.5, 5.0)
+SPAWN_SEED = None  # 숫자로 정하면 매번 같은 배치가 나옴 (벤치마크용)
+
 # --- Pygame 초기화 ---
 pygame.init()
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -31,131 +50,103 @@ except:
     font = pygame.font.Font(None, 24)
     small_font = pygame.font.Font(None, 20)
 
-# --- 게임 객체 클래스 ---
-class GameObject:
-    def __init__(self, x, y, radius, color, mass=1.0, is_static=False):
-        self.pos = pygame.math.Vector2(x, y)
-        self.radius = radius
-        self.color = color
-        self.mass = mass if not is_static else float('inf')
-        self.is_static = is_static
-        self.velocity = pygame.math.Vector2(0, 0)
-        self.external_force = pygame.math.Vector2(0, 0)
-        self.selected = False
-
-    def apply_force(self, force_vector):
-        if not self.is_static:
-            acceleration = force_vector / self.mass
-            self.velocity += acceleration
-
-    def check_collision(self, other):
-        """다른 객체와의 충돌 검사"""
-        if self == other or (self.is_static and other.is_static):
-            return False
-        
-        distance = self.pos.distance_to(other.pos)
-        return distance < (self.radius + other.radius)
+# --- 그리기 ---
+def draw_body(surface, state, selected, camera):
+    # 원 그리기 (월드 좌표 -> 화면 좌표)
+    sx, sy = camera.world_to_screen(state.x, state.y)
+    radius = max(1, int(state.radius * camera.zoom))
+    pygame.draw.circle(surface, state.color, (int(sx), int(sy)), radius)
 
-    def resolve_collision(self, other):
-        if self.is_static and other.is_static:
-            return
-        
-        # 두 공의 중심 사이의 거리와 방향 계산 (피타고라스 정리 사용)
-        dx = other.pos.x - self.pos.x  # x축 거리차
-        dy = other.pos.y - self.pos.y  # y축 거리차
-        distance = math.sqrt(dx*dx + dy*dy)  # 직선거리 = √(dx² + dy²)
-        
-        if distance == 0:
-            return
-        
-        # 겹친 부분을 분리 (단순히 반반씩 밀어냄)
-        overlap = (self.radius + other.radius) - distance
-        
-        # 방향을 단위벡터로 만들기 (전체 거리로 나누면 방향만 남음)
-        direction_x = dx / distance  # x방향 (-1 ~ 1 사이 값)
-        direction_y = dy / distance  # y방향 (-1 ~ 1 사이 값)
-        
-        # 겹친 만큼 객체들을 분리
-        move_distance = overlap / 2
-        if not self.is_static:
-            self.pos.x -= direction_x * move_distance
-            self.pos.y -= direction_y * move_distance
-        if not other.is_static:
-            other.pos.x += direction_x * move_distance
-            other.pos.y += direction_y * move_distance
-        
-        # 충돌 방향으로의 속도만 계산 (내적 대신 단순 곱셈과 덧셈)
-        # 각 공의 속도를 충돌 방향으로 투영
-        v1_collision = self.velocity.x * direction_x + self.velocity.y * direction_y
-        v2_collision = other.velocity.x * direction_x + other.velocity.y * direction_y
-        
-        # 이미 분리되고 있으면 더이상 처리하지 않음
-        if v1_collision - v2_collision <= 0:
-            return
-        
-        # 질량 처리 (정적 객체는 매우 무거운 것으로 처리)
-        if self.is_static:
-            m1 = 999999
-        else:
-            m1 = self.mass
-            
-        if other.is_static:
-            m2 = 999999
-        else:
-            m2 = other.mass
-        
-        # 완전 탄성 충돌 공식 (고등학교 물리 공식 그대로)
-        # 새로운 속도 = ((자신질량-상대질량) × 자신속도 + 2×상대질량×상대속도) ÷ (질량합)
-        new_v1_collision = ((m1 - m2) * v1_collision + 2 * m2 * v2_collision) / (m1 + m2)
-        new_v2_collision = ((m2 - m1) * v2_collision + 2 * m1 * v1_collision) / (m1 + m2)
-        
-        # 속도 변화량 계산
-        v1_change = (new_v1_collision - v1_collision) 
-        v2_change = (new_v2_collision - v2_collision) 
-        
-        # 충돌 방향으로만 속도 변경 (충돌과 수직인 방향은 그대로 유지)
-        if not self.is_static:
-            self.velocity.x += direction_x * v1_change
-            self.velocity.y += direction_y * v1_change
-        if not other.is_static:
-            other.velocity.x += direction_x * v2_change
-            other.velocity.y += direction_y * v2_change
-
-    def update(self, dt):
-        if not self.is_static:
-            # 외부 힘이 있으면 지속적으로 적용
-            if self.external_force.length_squared() > 0:
-                self.apply_force(self.external_force * dt)
-
-            self.pos += self.velocity * dt
-            
-            # 객체를 화면 경계 내에 유지
-            if self.pos.x - self.radius < 0 or self.pos.x + self.radius > SCREEN_WIDTH:
-                self.velocity.x *= -1  # 에너지 손실과 함께 반사
-                self.pos.x = max(self.radius, min(SCREEN_WIDTH - self.radius, self.pos.x))
-            
-            if self.pos.y - self.radius < 0:
-                self.velocity.y *= -1
-                self.pos.y = self.radius
-            
-            if self.pos.y + self.radius > SCREEN_HEIGHT - 160:  # UI 영역 고려
-                self.velocity.y *= -1
-                self.pos.y = SCREEN_HEIGHT - 160 - self.radius
+    if selected:
+        pygame.draw.circle(surface, LIGHT_BLUE, (int(sx), int(sy)), radius + 3, 3)
 
-    def draw(self, surface):
-        # 원 그리기
-        pygame.draw.circle(surface, self.color, (int(self.pos.x), int(self.pos.y)), int(self.radius))
-        
-        if self.selected:
-            pygame.draw.circle(surface, LIGHT_BLUE, (int(self.pos.x), int(self.pos.y)), 
-                             int(self.radius + 3), 3)
+def draw_density(surface, snapshot, camera):
+    """격자 칸별 원 개수를 색 진하기로 그림 (비용이 원 개수와 무관)"""
+    counts, (x0, y0, x1, y1) = snapshot.grid.density(*camera.visible_rect())
+    if counts.size == 0 or counts.max() == 0:
+        return
+    shade = (255 * (1 - counts / counts.max())).astype(np.uint8).T  # surfarray는 (가로, 세로) 순서
+    image = np.dstack((shade, shade, np.full_like(shade, 255)))
+    left, top = camera.world_to_screen(x0, y0)
+    right, bottom = camera.world_to_screen(x1, y1)
+    tile = pygame.transform.scale(pygame.surfarray.make_surface(image),
+                                  (max(1, int(right - left)), max(1, int(bottom - top))))
+    surface.blit(tile, (int(left), int(top)))
+
+def draw_level(surface, level, camera):
+    """화면에 보이는 정적 지형 선분 그리기"""
+    for x1, y1, x2, y2 in level.query(*camera.visible_rect()):
+        pygame.draw.line(surface, BLACK, camera.world_to_screen(x1, y1), camera.world_to_screen(x2, y2), 3)
+
+def visible_indices(snapshot, rect):
+    """rect(월드 좌표)와 겹칠 수 있는 원들의 번호"""
+    x0, y0, x1, y1 = rect
+    margin = snapshot.max_radius
+    return snapshot.grid.query(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+
+def is_clicked(state, wx, wy):
+    return math.hypot(state.x - wx, state.y - wy) < state.radius
+
+def pick_body(snapshot, wx, wy):
+    """월드 좌표 (wx, wy)에 있는 가장 위쪽(나중에 추가된) 원"""
+    for i in sorted(visible_indices(snapshot, (wx, wy, wx, wy)).tolist(), reverse=True):
+        if is_clicked(snapshot.bodies[i], wx, wy):
+            return snapshot.bodies[i]
+    return None
+
+def visible_world_region(camera):
+    """화면에 보이는 월드 영역을 월드 경계로 자른 것"""
+    x0, y0, x1, y1 = camera.visible_rect()
+    return max(x0, 0), max(y0, 0), min(x1, WORLD_WIDTH), min(y1, WORLD_HEIGHT)
+
+def spawn_many(snapshot, count, region):
+    """region의 빈 공간에 겹치지 않게 원 count개를 만들어서 돌려줌"""
+    nearby = [snapshot.bodies[i] for i in visible_indices(snapshot, region).tolist()]
+    existing = ([s.x for s in nearby], [s.y for s in nearby], [s.radius for s in nearby])
+    try:
+        batch = spawn_bodies(count, region,
+                             radius=BULK_SPAWN_RADIUS, mass=BULK_SPAWN_MASS,
+                             seed=SPAWN_SEED, existing=existing, level=level)
+    except ValueError:
+        return []  # 빈 공간이 부족함
+    colors = [RED, GREEN, BLUE, YELLOW, PURPLE, ORANGE]
+    return [GameObject(x, y, r, colors[i % len(colors)], mass=m)
+            for i, (x, y, r, m) in enumerate(zip(batch.x.tolist(), batch.y.tolist(),
+                                                 batch.radius.tolist(), batch.mass.tolist()))]
+
+def draw_sparkline(surface, values, rect, color):
+    """값 배열을 rect 안에 꺾은선으로 그림 (최소~최대를 높이에 맞춤)"""
+    pygame.draw.rect(surface, WHITE, rect)
+    pygame.draw.rect(surface, BLACK, rect, 1)
+    if len(values) < 2:
+        return
+    x, y, width, height = rect
+    low, high = float(values.min()), float(values.max())
+    span = high - low if high > low else 1.0
+    step = max(1, len(values) // width)  # 가로 픽셀보다 많으면 솎아냄
+    values = values[::step]
+    points = [(x + i * (width - 1) / (len(values) - 1), y + height - 1 - (v - low) / span * (height - 1))
+              for i, v in enumerate(values.tolist())]
+    pygame.draw.lines(surface, color, False, points)
 
-    def is_clicked(self, mouse_pos):
-        return self.pos.distance_to(mouse_pos) < self.radius
+def export_telemetry(history, basename):
+    """스냅샷의 보존량 히스토리를 .csv/.npy로 저장 (렌더 루프와 물리 스텝이 멈추지 않게 별도 스레드에서)"""
+    def write():
+        export_rows(history, basename + ".csv")
+        export_rows(history, basename + ".npy")
+    threading.Thread(target=write).start()
+
+def find_state(snapshot, body):
+    i = snapshot.index.get(body)
+    return snapshot.bodies[i] if i is not None else None
 
 # --- 게임 변수 ---
-objects = []
-selected_object: GameObject = None
+level = load_level(sys.argv[1]) if len(sys.argv) > 1 else None  # 예: python main.py levels/funnel.json
+physics = PhysicsWorker(level=level)  # 물리 스텝은 이 스레드가 담당
+camera = Camera(SCREEN_WIDTH, VIEW_HEIGHT)
+camera.fit(WORLD_WIDTH, WORLD_HEIGHT)
+panning = False
+selected_object: GameObject = None  # 물리 스레드에 명령을 보낼 때 쓰는 핸들
 dragging = False
 show_debug_info = True
 input_mode = None  # 커스텀 힘 입력용: "force_x", "force_y", None
@@ -169,9 +160,11 @@ def draw_text(text, position, surface, color=BLACK, font_size="normal"):
     surface.blit(text_surface, position)
 
 # --- 메인 게임 루프 ---
+physics.start()
 running = True
 while running:
     dt = clock.tick(FPS) / 1000.0  # 델타 타임 (초 단위)
+    snapshot = physics.snapshot  # 물리 스레드가 마지막으로 공개한 상태 (잠금 없음)
     
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -190,7 +183,7 @@ while running:
                         elif input_mode == "force_y":
                             current_input_force[1] = force_value
                             if selected_object:
-                                selected_object.external_force = pygame.math.Vector2(current_input_force[0], current_input_force[1])
+                                physics.send("set_force", selected_object, current_input_force[0], current_input_force[1])
                             input_mode = None
                             input_text = ""
                             current_input_force = [0, 0]
@@ -213,102 +206,98 @@ while running:
             
             if event.key == pygame.K_ESCAPE:
                 running = False
-            if event.key == pygame.K_c:  # 원 추가
-                x = random.randint(100, SCREEN_WIDTH - 100)
-                y = random.randint(100, SCREEN_HEIGHT - 250)
+            if event.key == pygame.K_c:  # 원 추가 (지금 보이는 영역 안에)
+                x0, y0, x1, y1 = visible_world_region(camera)
                 radius = random.randint(15, 40)
+                x = random.uniform(x0 + radius, max(x0 + radius, x1 - radius))
+                y = random.uniform(y0 + radius, max(y0 + radius, y1 - radius))
                 color = random.choice([RED, GREEN, BLUE, YELLOW, PURPLE, ORANGE])
-                objects.append(GameObject(x, y, radius, color, mass=2.0))
+                physics.send("add", GameObject(x, y, radius, color, mass=2.0))
+            if event.key == pygame.K_b:  # 원 여러 개를 겹치지 않게 한꺼번에 추가
+                physics.send("add_many", spawn_many(snapshot, BULK_SPAWN_COUNT, visible_world_region(camera)))
+            if event.key == pygame.K_HOME:  # 월드 전체 보기
+                camera.fit(WORLD_WIDTH, WORLD_HEIGHT)
             if event.key == pygame.K_d:  # 디버그 정보 토글
                 show_debug_info = not show_debug_info
+            if event.key == pygame.K_t:  # 보존량 기록을 CSV/NPY로 저장
+                export_telemetry(snapshot.telemetry.history, time.strftime("telemetry_%Y%m%d_%H%M%S"))
             if event.key == pygame.K_DELETE or event.key == pygame.K_BACKSPACE:  # 선택된 객체 삭제
-                if selected_object and selected_object in objects:
-                    objects.remove(selected_object)
+                if selected_object:
+                    physics.send("remove", selected_object)
                     selected_object = None
+                    dragging = False
             
             # 선택된 객체가 있을 때의 조작
             if selected_object:
                 if event.key == pygame.K_s:  # 정적 상태 토글
-                    selected_object.is_static = not selected_object.is_static
-                    selected_object.mass = float('inf') if selected_object.is_static else random.uniform(1.0, 5.0)
-                    selected_object.velocity = pygame.math.Vector2(0, 0)
+                    physics.send("toggle_static", selected_object)
                 if event.key == pygame.K_UP:  # 질량 증가
-                    if not selected_object.is_static:
-                        selected_object.mass = round(selected_object.mass + 0.5, 1)
+                    physics.send("mass", selected_object, 0.5)
                 if event.key == pygame.K_DOWN:  # 질량 감소
-                    if not selected_object.is_static and selected_object.mass > 0.5:
-                        selected_object.mass = round(selected_object.mass - 0.5, 1)
+                    physics.send("mass", selected_object, -0.5)
                 if event.key == pygame.K_v:  # 개별 객체 중력 (아래 방향)
-                    if selected_object.external_force.y > 0:
-                        selected_object.external_force = pygame.math.Vector2(0, 0)
-                    else:
-                        selected_object.external_force = pygame.math.Vector2(0, 100*selected_object.mass)
+                    physics.send("toggle_gravity", selected_object)
                 if event.key == pygame.K_x:  # 커스텀 힘 입력
                     input_mode = "force_x"
                     input_text = ""
                     current_input_force = [0, 0]
 
         if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:  # 왼쪽 클릭
-                clicked_on_object = False
-                for obj in reversed(objects):  # 최상단 객체부터 확인
-                    if obj.is_clicked(event.pos):
-                        if selected_object:
-                            selected_object.selected = False
-                        selected_object = obj
-                        selected_object.selected = True
-                        dragging = True
-                        clicked_on_object = True
-                        break
-                if not clicked_on_object:
-                    if selected_object:
-                        selected_object.selected = False
+            if event.button == 1 and event.pos[1] < VIEW_HEIGHT:  # 왼쪽 클릭 (UI 패널 제외)
+                state = pick_body(snapshot, *camera.screen_to_world(*event.pos))
+                if state:
+                    selected_object = state.body
+                    dragging = True
+                else:
                     selected_object = None
+            if event.button == 3:  # 오른쪽 드래그로 화면 이동
+                panning = True
         
         if event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:  # 왼쪽 클릭
                 dragging = False
+            if event.button == 3:
+                panning = False
+
+        if event.type == pygame.MOUSEWHEEL:  # 휠로 마우스 위치 기준 확대/축소
+            camera.zoom_at(*pygame.mouse.get_pos(), 1.1 ** event.y)
 
         if event.type == pygame.MOUSEMOTION:
+            if panning:
+                camera.pan(*event.rel)
             if dragging and selected_object:
-                selected_object.pos = pygame.math.Vector2(event.pos)
-                # 드래그된 객체를 경계 내에 유지
-                selected_object.pos.x = max(selected_object.radius, min(SCREEN_WIDTH - selected_object.radius, selected_object.pos.x))
-                selected_object.pos.y = max(selected_object.radius, min(SCREEN_HEIGHT - 200, selected_object.pos.y))
-                if not selected_object.is_static:
-                    selected_object.velocity = pygame.math.Vector2(0, 0)
-
-    # --- 게임 로직 ---
-    
-    # 모든 객체 업데이트
-    for obj in objects:
-        obj.update(dt)
-    
-    # 모든 객체 간 충돌 검사
-    for i in range(len(objects)):
-        for j in range(i + 1, len(objects)):
-            obj1 = objects[i]
-            obj2 = objects[j]
-            if obj1.check_collision(obj2):
-                obj1.resolve_collision(obj2)
+                physics.send("drag", selected_object, *camera.screen_to_world(*event.pos))
 
     # --- 그리기 ---
     screen.fill(WHITE)
-    for obj in objects:
-        obj.draw(screen)
+    visible = visible_indices(snapshot, camera.visible_rect())
+    if camera.zoom < DENSITY_ZOOM or len(visible) > MAX_DRAWN_BODIES:
+        draw_density(screen, snapshot, camera)
+    else:
+        for i in visible.tolist():
+            state = snapshot.bodies[i]
+            draw_body(screen, state, state.body is selected_object, camera)
+
+    if level is not None:
+        draw_level(screen, level, camera)
+
+    # 월드 경계
+    left, top = camera.world_to_screen(0, 0)
+    right, bottom = camera.world_to_screen(WORLD_WIDTH, WORLD_HEIGHT)
+    pygame.draw.rect(screen, BLACK, (int(left), int(top), int(right - left), int(bottom - top)), 1)
 
     # --- UI 및 정보 ---
     ui_start_y = SCREEN_HEIGHT - 150
     pygame.draw.rect(screen, GRAY, (0, ui_start_y, SCREEN_WIDTH, 150))
     
     # 조작법 안내
-    draw_text("조작법: (C)원 추가", 
+    draw_text(f"조작법: (C)원 추가 | (B)원 {BULK_SPAWN_COUNT}개 한꺼번에 추가", 
               (10, ui_start_y + 5), screen, BLACK, "small")
-    draw_text("(DEL)선택된 객체 삭제 | (D)정보 표시 토글 | (S)정지/움직임 토글", 
+    draw_text("(DEL)선택된 객체 삭제 | (D)정보 표시 토글 | (S)정지/움직임 토글 | (T)보존량 기록 저장", 
               (10, ui_start_y + 25), screen, BLACK, "small")
     draw_text("선택된 객체: (↑/↓)질량 | (V)개별 중력 토글 | (X)커스텀 외력 설정", 
               (10, ui_start_y + 45), screen, BLACK, "small")
-    draw_text("마우스로 클릭해서 선택하고 드래그로 이동", 
+    draw_text("마우스로 클릭해서 선택하고 드래그로 이동 | 오른쪽 드래그: 화면 이동 | 휠: 확대/축소 | (HOME)전체 보기", 
               (10, ui_start_y + 65), screen, BLACK, "small")
 
     # 커스텀 힘 입력 표시
@@ -319,22 +308,38 @@ while running:
             draw_text(f"Y축 힘 입력: {input_text}_ (X: {current_input_force[0]})", (SCREEN_WIDTH - 300, ui_start_y + 45), screen, RED, "small")
 
     # 객체 정보
-    if selected_object and show_debug_info:
+    selected_state = find_state(snapshot, selected_object) if selected_object else None
+    if selected_state and show_debug_info:
         info_text = [
             f"선택된 객체: 원",
-            f"  위치: ({selected_object.pos.x:.1f}, {selected_object.pos.y:.1f})",
-            f"  질량: {'정지' if selected_object.is_static else f'{selected_object.mass:.1f}'}",
-            f"  속도: ({selected_object.velocity.x:.1f}, {selected_object.velocity.y:.1f})",
-            f"  외부 힘: ({selected_object.external_force.x:.1f}, {selected_object.external_force.y:.1f})"
+            f"  위치: ({selected_state.x:.1f}, {selected_state.y:.1f})",
+            f"  질량: {'정지' if selected_state.is_static else f'{selected_state.mass:.1f}'}",
+            f"  속도: ({selected_state.vx:.1f}, {selected_state.vy:.1f})",
+            f"  외부 힘: ({selected_state.fx:.1f}, {selected_state.fy:.1f})"
         ]
         for i, line in enumerate(info_text):
             draw_text(line, (10, 10 + i * 22), screen, BLACK, "small")
     elif show_debug_info:
         draw_text("객체를 클릭해서 선택하세요.", (10, 10), screen, BLACK, "small")
 
-    # 객체 개수 표시
-    draw_text(f"총 객체 수: {len(objects)}", (SCREEN_WIDTH - 150, 10), screen, BLACK, "small")
+    # 객체 개수 및 물리 스레드 상태 표시
+    draw_text(f"총 객체 수: {len(snapshot.bodies)}", (SCREEN_WIDTH - 150, 10), screen, BLACK, "small")
+    draw_text(f"물리 스텝: {physics.last_step_time * 1000:.2f}ms", (SCREEN_WIDTH - 150, 30), screen, BLACK, "small")
+    draw_text(f"보이는 객체 수: {len(visible)} (x{camera.zoom:.2f})", (SCREEN_WIDTH - 420, 10), screen, BLACK, "small")
+
+    # 보존량 (운동에너지 그래프와 드리프트)
+    telemetry = snapshot.telemetry  # 같은 스텝에서 물리 스레드가 만들어 둔 읽기 전용 기록
+    if show_debug_info and len(telemetry.history):
+        draw_sparkline(screen, telemetry.history[:, KINETIC_ENERGY], (SCREEN_WIDTH - 260, 55, 250, 50), BLUE)
+        latest = telemetry.history[-1]
+        draw_text(f"운동에너지: {latest[KINETIC_ENERGY]:.0f}", (SCREEN_WIDTH - 260, 110), screen, BLACK, "small")
+        drift_color = RED if telemetry.energy_drift_flag else BLACK
+        draw_text(f"에너지 드리프트: {telemetry.energy_drift * 100:+.2f}%", (SCREEN_WIDTH - 260, 130), screen, drift_color, "small")
+        drift_color = RED if telemetry.momentum_drift_flag else BLACK
+        draw_text(f"운동량 드리프트: {telemetry.momentum_drift * 100:.2f}%", (SCREEN_WIDTH - 260, 150), screen, drift_color, "small")
 
     pygame.display.flip()
 
-pygame.quit()
+physics.stop()
+physics.join()
+pygame.quit()
\ No newline at end of file
@@ -1,10 +1,12 @@
 import pygame
 import math
 import random
+import time
+
+from telemetry import ConservationTelemetry, KINETIC_ENERGY, arrays_from_objects
+from world_new import GameObject, SCREEN_WIDTH, SCREEN_HEIGHT, measure_step_allocations, step_world
 
 # --- Constants ---
-SCREEN_WIDTH = 1200
-SCREEN_HEIGHT = 800
 FPS = 60
 
 WHITE = (255, 255, 255)
@@ -31,120 +33,19 @@ except:
     font = pygame.font.Font(None, 24)
     small_font = pygame.font.Font(None, 20)
 
-# --- GameObject Class ---
-class GameObject:
-    def __init__(self, x, y, radius, color, mass=1.0, is_static=False):
-        self.pos = pygame.math.Vector2(x, y)
-        self.radius = radius
-        self.color = color
-        self.mass = mass if not is_static else float('inf')
-        self.is_static = is_static
-        self.velocity = pygame.math.Vector2(0, 0)
-        self.angle = 0  # Degrees
-        self.angular_velocity = 0  # Degrees per second
-        self.external_force = pygame.math.Vector2(0, 0)
-        self.selected = False
-
-    def apply_force(self, force_vector):
-        if not self.is_static:
-            acceleration = force_vector / self.mass
-            self.velocity += acceleration
-
-    def check_collision(self, other):
-        """Check collision with another object"""
-        if self == other or (self.is_static and other.is_static):
-            return False
-        
-        distance = self.pos.distance_to(other.pos)
-        return distance < (self.radius + other.radius)
-
-    def resolve_collision(self, other):
-        """Resolve collision with another object"""
-        if self.is_static and other.is_static:
-            return
-        
-        # Calculate collision vector
-        collision_vector = other.pos - self.pos
-        distance = collision_vector.length()
-        
-        if distance == 0:
-            return
-        
-        # Normalize collision vector
-        collision_normal = collision_vector / distance
-        
-        # Separate objects
-        overlap = (self.radius + other.radius) - distance
-        separation = collision_normal * (overlap / 2)
-        
-        if not self.is_static:
-            self.pos -= separation
-        if not other.is_static:
-            other.pos += separation
-        
-        # Calculate relative velocity
-        relative_velocity = other.velocity - self.velocity
-        velocity_along_normal = relative_velocity.dot(collision_normal)
-        
-        # Don't resolve if velocities are separating
-        if velocity_along_normal > 0:
-            return
-        
-        # Calculate restitution (bounciness)
-        restitution = 0.8
-        
-        # Calculate impulse scalar
-        impulse_scalar = -(1 + restitution) * velocity_along_normal
-        impulse_scalar /= (1/self.mass + 1/other.mass) if not self.is_static and not other.is_static else 1
-        
-        # Apply impulse
-        impulse = impulse_scalar * collision_normal
-        
-        if not self.is_static:
-            self.velocity -= impulse / self.mass
-        if not other.is_static:
-            other.velocity += impulse / other.mass
-
-    def update(self, dt):
-        if not self.is_static:
-            # Apply external force (if any) continuously
-            if self.external_force.length_squared() > 0:
-                self.apply_force(self.external_force * dt)
-
-            # Apply simple damping to prevent infinite acceleration
-            self.velocity *= 0.999
-
-            self.pos += self.velocity * dt
-            self.angle = (self.angle + self.angular_velocity * dt) % 360
-            
-            # Keep objects within screen bounds
-            if self.pos.x - self.radius < 0 or self.pos.x + self.radius > SCREEN_WIDTH:
-                self.velocity.x *= -0.8  # Bounce with energy loss
-                self.pos.x = max(self.radius, min(SCREEN_WIDTH - self.radius, self.pos.x))
-            
-            if self.pos.y - self.radius < 0:
-                self.velocity.y *= -0.8
-                self.pos.y = self.radius
-            
-            if self.pos.y + self.radius > SCREEN_HEIGHT - 160:  # Account for UI area
-                self.velocity.y *= -0.8
-                self.pos.y = SCREEN_HEIGHT - 160 - self.radius
-
-    def draw(self, surface):
-        # Draw circle
-        pygame.draw.circle(surface, self.color, (int(self.pos.x), int(self.pos.y)), int(self.radius))
-        
-        # Draw a line to indicate angle
-        end_x = self.pos.x + self.radius * math.cos(math.radians(self.angle))
-        end_y = self.pos.y + self.radius * math.sin(math.radians(self.angle))
-        pygame.draw.line(surface, BLACK, self.pos, (end_x, end_y), 2)
-        
-        if self.selected:
-            pygame.draw.circle(surface, LIGHT_BLUE, (int(self.pos.x), int(self.pos.y)), 
-                             int(self.radius + 3), 3)
-
-    def is_clicked(self, mouse_pos):
-        return self.pos.distance_to(mouse_pos) < self.radius
+# --- Drawing ---
+def draw_object(surface, obj):
+    # Draw circle
+    pygame.draw.circle(surface, obj.color, (int(obj.pos.x), int(obj.pos.y)), int(obj.radius))
+    
+    # Draw a line to indicate angle
+    end_x = obj.pos.x + obj.radius * math.cos(math.radians(obj.angle))
+    end_y = obj.pos.y + obj.radius * math.sin(math.radians(obj.angle))
+    pygame.draw.line(surface, BLACK, obj.pos, (end_x, end_y), 2)
+    
+    if obj.selected:
+        pygame.draw.circle(surface, LIGHT_BLUE, (int(obj.pos.x), int(obj.pos.y)), 
+                         int(obj.radius + 3), 3)
 
 # --- Game Variables ---
 objects = []
@@ -152,6 +53,12 @@ selected_object = None
 dragging = False
 show_debug_info = True
 gravity_enabled = False  # Global gravity toggle
+allocation_report = None  # (bodies, net_bytes, peak_bytes) from the last (M) measurement
+telemetry = ConservationTelemetry()  # Per-step energy/momentum totals
+step_count = 0
+# Keys that edit the scene; the totals change on purpose, so drift is measured from there
+STATE_KEYS = (pygame.K_a, pygame.K_c, pygame.K_DELETE, pygame.K_BACKSPACE, pygame.K_s, pygame.K_z,
+              pygame.K_UP, pygame.K_DOWN, pygame.K_f, pygame.K_v)
 
 # --- Helper Functions ---
 def draw_text(text, position, surface, color=BLACK, font_size="normal"):
@@ -159,6 +66,21 @@ def draw_text(text, position, surface, color=BLACK, font_size="normal"):
     text_surface = chosen_font.render(text, True, color)
     surface.blit(text_surface, position)
 
+def draw_sparkline(surface, values, rect, color):
+    """Draw values as a polyline scaled to fit inside rect"""
+    pygame.draw.rect(surface, WHITE, rect)
+    pygame.draw.rect(surface, BLACK, rect, 1)
+    if len(values) < 2:
+        return
+    x, y, width, height = rect
+    low, high = float(values.min()), float(values.max())
+    span = high - low if high > low else 1.0
+    step = max(1, len(values) // width)  # Thin out when there are more samples than pixels
+    values = values[::step]
+    points = [(x + i * (width - 1) / (len(values) - 1), y + height - 1 - (v - low) / span * (height - 1))
+              for i, v in enumerate(values.tolist())]
+    pygame.draw.lines(surface, color, False, points)
+
 def create_random_object():
     x = random.randint(100, SCREEN_WIDTH - 100)
     y = random.randint(100, SCREEN_HEIGHT - 250)
@@ -178,6 +100,8 @@ while running:
             running = False
         
         if event.type == pygame.KEYDOWN:
+            if event.key in STATE_KEYS:
+                telemetry.reset_reference()
             if event.key == pygame.K_ESCAPE:
                 running = False
             if event.key == pygame.K_a:  # Add a new random object
@@ -196,13 +120,20 @@ while running:
                     selected_object = None
             if event.key == pygame.K_z:  # Toggle global gravity
                 gravity_enabled = not gravity_enabled
+            if event.key == pygame.K_t:  # Export conservation history
+                basename = time.strftime("telemetry_%Y%m%d_%H%M%S")
+                telemetry.export(basename + ".csv")
+                telemetry.export(basename + ".npy")
+            if event.key == pygame.K_m:  # Measure per-step allocations on a throwaway scene this size
+                net_bytes, peak_bytes = measure_step_allocations(len(objects), dt, gravity_enabled)
+                allocation_report = (len(objects), net_bytes, peak_bytes)
             
             # Controls for selected object (if any)
             if selected_object:
                 if event.key == pygame.K_s:  # Toggle static state
                     selected_object.is_static = not selected_object.is_static
                     selected_object.mass = float('inf') if selected_object.is_static else random.uniform(1.0, 5.0)
-                    selected_object.velocity = pygame.math.Vector2(0, 0)
+                    selected_object.velocity.update(0, 0)
                 if event.key == pygame.K_UP:  # Increase mass
                     if not selected_object.is_static:
                         selected_object.mass = round(selected_object.mass + 0.5, 1)
@@ -219,14 +150,14 @@ while running:
                 # External forces
                 if event.key == pygame.K_f:  # Force right
                     if selected_object.external_force.x > 0:
-                        selected_object.external_force = pygame.math.Vector2(0, 0)
+                        selected_object.external_force.update(0, 0)
                     else:
-                        selected_object.external_force = pygame.math.Vector2(100, 0)
+                        selected_object.external_force.update(100, 0)
                 if event.key == pygame.K_v:  # Gravity down (individual object)
                     if selected_object.external_force.y > 0:
-                        selected_object.external_force = pygame.math.Vector2(0, 0)
+                        selected_object.external_force.update(0, 0)
                     else:
-                        selected_object.external_force = pygame.math.Vector2(0, 200)
+                        selected_object.external_force.update(0, 200)
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
@@ -251,36 +182,25 @@ while running:
 
         if event.type == pygame.MOUSEMOTION:
             if dragging and selected_object:
-                selected_object.pos = pygame.math.Vector2(event.pos)
+                telemetry.reset_reference()
+                selected_object.pos.update(event.pos)
                 # Keep dragged object within bounds
                 selected_object.pos.x = max(selected_object.radius, min(SCREEN_WIDTH - selected_object.radius, selected_object.pos.x))
                 selected_object.pos.y = max(selected_object.radius, min(SCREEN_HEIGHT - 200, selected_object.pos.y))
                 if not selected_object.is_static:
-                    selected_object.velocity = pygame.math.Vector2(0, 0)
+                    selected_object.velocity.update(0, 0)
 
     # --- Game Logic ---
-    # Apply global gravity if enabled
-    if gravity_enabled:
-        for obj in objects:
-            if not obj.is_static:
-                obj.apply_force(pygame.math.Vector2(0, obj.mass * 200 * dt))  # Gravity force
-    
-    # Update all objects
-    for obj in objects:
-        obj.update(dt)
-    
-    # Check collisions between all objects
-    for i in range(len(objects)):
-        for j in range(i + 1, len(objects)):
-            obj1 = objects[i]
-            obj2 = objects[j]
-            if obj1.check_collision(obj2):
-                obj1.resolve_collision(obj2)
+    impulse = [0.0, 0.0]
+    step_world(objects, dt, gravity_enabled, impulse)
+    step_count += 1
+    if dt > 0:
+        telemetry.record(step_count, *arrays_from_objects(objects, 200 if gravity_enabled else 0), dt, impulse)
 
     # --- Drawing ---
     screen.fill(WHITE)
     for obj in objects:
-        obj.draw(screen)
+        draw_object(screen, obj)
 
     # --- UI & Info ---
     ui_start_y = SCREEN_HEIGHT - 150
@@ -293,7 +213,7 @@ while running:
               (10, ui_start_y + 25), screen, BLACK, "small")
     draw_text("선택된 객체: (↑/↓)질량 | (←/→)회전 | (SPACE)회전 정지", 
               (10, ui_start_y + 45), screen, BLACK, "small")
-    draw_text("(F)오른쪽 힘 토글 | (V)개별 중력 토글", 
+    draw_text("(F)오른쪽 힘 토글 | (V)개별 중력 토글 | (M)스텝 메모리 할당 측정 | (T)보존량 기록 저장", 
               (10, ui_start_y + 65), screen, BLACK, "small")
     draw_text("마우스로 클릭해서 선택하고 드래그로 이동", 
               (10, ui_start_y + 85), screen, BLACK, "small")
@@ -320,6 +240,19 @@ while running:
 
     # Show object count
     draw_text(f"총 객체 수: {len(objects)}", (SCREEN_WIDTH - 150, 10), screen, BLACK, "small")
+    if allocation_report and show_debug_info:
+        bodies, net_bytes, peak_bytes = allocation_report
+        draw_text(f"할당({bodies}개): 순증 {net_bytes}B / 최대 {peak_bytes}B", (SCREEN_WIDTH - 300, 30), screen, BLACK, "small")
+
+    # Conservation telemetry (kinetic energy sparkline and drift)
+    if show_debug_info and len(telemetry):
+        draw_sparkline(screen, telemetry.history(KINETIC_ENERGY), (SCREEN_WIDTH - 260, 55, 250, 50), BLUE)
+        latest = telemetry.latest()
+        draw_text(f"운동에너지: {latest[KINETIC_ENERGY]:.0f}", (SCREEN_WIDTH - 260, 110), screen, BLACK, "small")
+        drift_color = RED if telemetry.energy_drift_flag else BLACK
+        draw_text(f"에너지 드리프트: {telemetry.energy_drift * 100:+.2f}%", (SCREEN_WIDTH - 260, 130), screen, drift_color, "small")
+        drift_color = RED if telemetry.momentum_drift_flag else BLACK
+        draw_text(f"운동량 드리프트: {telemetry.momentum_drift * 100:.2f}%", (SCREEN_WIDTH - 260, 150), screen, drift_color, "small")
 
     pygame.display.flip()
 
@@ -0,0 +1,391 @@
+"""무거운 시뮬레이션 프로세스 하나가 여러 뷰어에 상태를 뿌려주는 로컬 서버
+
+서버는 PhysicsWorker로 월드를 돌리면서 정해진 주기(--rate)마다 바이너리 상태
+프레임을 TCP(또는 유닉스 소켓)로 보낸다. 클라이언트마다 마지막으로 보낸 상태를
+기억해서 바뀐 원만 보내고(델타), 아직 이전 프레임을 다 못 받은 느린 클라이언트는
+그 사이 프레임들을 건너뛰고 다음에 한꺼번에 받는다(병합). 반대 방향으로는
+JSON 명령(main.py의 드래그, S, V, X, 질량 키와 같은 조작)을 받는다.
+
+    python server.py --bodies 300 --rate 30
+    python viewer.py            # 뷰어는 여러 개 띄워도 됨
+"""
+import argparse
+import json
+import math
+import os
+import selectors
+import socket
+import stat
+import struct
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from level import load_level
+from spawner import spawn_bodies
+from world import GameObject, PhysicsWorker, WORLD_WIDTH, WORLD_HEIGHT
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 50007
+
+# --- 프로토콜 ---
+# 모든 메시지: [길이 u32][내용]
+# 서버 -> 클라이언트 내용: HEADER + RECORD × 개수 + 지워진 id(u32) × 개수
+# 클라이언트 -> 서버 내용: UTF-8 JSON 객체 {"cmd": ..., ...}
+LENGTH = struct.Struct("<I")
+HEADER = struct.Struct("<4sBIII")  # 매직, 종류, 스텝, 레코드 수, 지워진 id 수
+RECORD = struct.Struct("<IfffBBBB")  # id, x, y, 반지름, r, g, b, 플래그
+MAGIC = b"SIMF"
+KEYFRAME = 0  # 전체 상태
+DELTA = 1  # 직전에 보낸 상태에서 바뀐 것만
+FLAG_STATIC = 1
+
+
+def pack_record(body_id, state):
+    r, g, b = state.color[:3]
+    return RECORD.pack(body_id, state.x, state.y, state.radius, r, g, b,
+                       FLAG_STATIC if state.is_static else 0)
+
+
+def _finite(value):
+    """명령의 숫자 값 검사 (NaN/무한대는 pack에서 터지거나 물리를 망가뜨림)"""
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"not a finite number: {value}")
+    return value
+
+
+def _color(value):
+    """명령의 색 검사: 0~255 정수 세 개"""
+    color = tuple(value)
+    if len(color) != 3 or not all(type(c) is int and 0 <= c <= 255 for c in color):
+        raise ValueError(f"color must be three ints in 0-255: {value}")
+    return color
+
+
+def encode_frame(kind, step, records, removed=()):
+    """레코드(이미 pack된 bytes)들로 길이 접두사까지 붙은 프레임 메시지를 만듦"""
+    payload = b"".join((HEADER.pack(MAGIC, kind, step, len(records), len(removed)),
+                        *records, struct.pack(f"<{len(removed)}I", *removed)))
+    return LENGTH.pack(len(payload)) + payload
+
+
+def decode_frame(payload):
+    """프레임 내용 -> (종류, 스텝, {id: (x, y, 반지름, 색, 정지 여부)}, 지워진 id 리스트)"""
+    magic, kind, step, count, removed_count = HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise ValueError("not a state frame")
+    bodies = {}
+    offset = HEADER.size
+    for _ in range(count):
+        body_id, x, y, radius, r, g, b, flags = RECORD.unpack_from(payload, offset)
+        bodies[body_id] = (x, y, radius, (r, g, b), bool(flags & FLAG_STATIC))
+        offset += RECORD.size
+    removed = list(struct.unpack_from(f"<{removed_count}I", payload, offset))
+    return kind, step, bodies, removed
+
+
+def split_messages(buffer):
+    """bytearray 앞쪽의 완성된 메시지들을 떼어내서 돌려줌 (남은 조각은 buffer에 그대로)"""
+    messages = []
+    while len(buffer) >= LENGTH.size:
+        (length,) = LENGTH.unpack_from(buffer)
+        if len(buffer) < LENGTH.size + length:
+            break
+        messages.append(bytes(buffer[LENGTH.size:LENGTH.size + length]))
+        del buffer[:LENGTH.size + length]
+    return messages
+
+
+def encode_command(cmd, **args):
+    payload = json.dumps(dict(args, cmd=cmd)).encode("utf-8")
+    return LENGTH.pack(len(payload)) + payload
+
+
+# --- 서버 ---
+class ClientConnection:
+    def __init__(self, sock):
+        self.sock = sock
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.known = None  # 이 클라이언트가 (보낸 것을 다 받으면) 갖게 될 {id: 레코드 bytes}
+        self.frames_sent = 0
+        self.frames_coalesced = 0  # 느려서 건너뛴(다음 델타에 합쳐진) 프레임 수
+
+
+class SimulationServer:
+    """PhysicsWorker의 스냅샷을 주기적으로 클라이언트들에게 보내는 서버
+
+    selectors 하나로 모든 소켓을 논블로킹으로 처리하므로 느린 클라이언트가
+    있어도 다른 클라이언트나 물리 스레드가 기다리지 않는다.
+    address가 문자열이면 유닉스 소켓 경로, (호스트, 포트)면 TCP.
+    """
+
+    def __init__(self, worker, address=(DEFAULT_HOST, DEFAULT_PORT), rate=30):
+        self.worker = worker
+        self.period = 1.0 / rate
+        self.clients = {}
+        self._ids = {}  # GameObject -> 네트워크 id
+        self._bodies_by_id = {}
+        self._next_id = 1
+        self._running = False
+        self.selector = selectors.DefaultSelector()
+
+        if isinstance(address, str):
+            # 이전 실행이 남긴 소켓 파일만 지움 (경로를 잘못 줘서 일반 파일을 지우지 않게)
+            if os.path.exists(address):
+                if not stat.S_ISSOCK(os.stat(address).st_mode):
+                    raise FileExistsError(f"{address} exists and is not a socket")
+                os.unlink(address)
+            self.listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(address)
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.address = self.listener.getsockname()  # 포트 0으로 열었을 때 실제 포트 확인용
+        self.selector.register(self.listener, selectors.EVENT_READ)
+
+    def serve_forever(self):
+        self._running = True
+        next_frame = time.perf_counter()
+        while self._running:
+            self.poll(max(0.0, next_frame - time.perf_counter()))
+            if time.perf_counter() >= next_frame:
+                self.broadcast()
+                next_frame += self.period
+                if next_frame < time.perf_counter():  # 밀렸으면 따라잡으려 하지 않음
+                    next_frame = time.perf_counter() + self.period
+
+    def stop(self):
+        self._running = False
+
+    def close(self):
+        for client in list(self.clients.values()):
+            self._drop(client)
+        self.selector.unregister(self.listener)
+        self.listener.close()
+        self.selector.close()
+        if isinstance(self.address, str) and os.path.exists(self.address):
+            os.unlink(self.address)
+
+    def poll(self, timeout=0.0):
+        """소켓 이벤트 처리 (연결 수락, 명령 읽기, 밀린 데이터 보내기)"""
+        for key, events in self.selector.select(timeout):
+            if key.fileobj is self.listener:
+                self._accept()
+                continue
+            client = key.data
+            if events & selectors.EVENT_READ:
+                self._read(client)
+            if events & selectors.EVENT_WRITE and client.sock.fileno() >= 0:
+                self._flush(client)
+
+    def broadcast(self):
+        """최신 스냅샷을 모든 클라이언트에게 (키프레임 또는 델타로) 보냄"""
+        snapshot = self.worker.snapshot
+        ids = {}
+        records = {}
+        for state in snapshot.bodies:
+            body_id = self._ids.get(state.body)
+            if body_id is None:
+                body_id = self._next_id
+                self._next_id += 1
+            ids[state.body] = body_id
+            records[body_id] = pack_record(body_id, state)
+        self._ids = ids
+        self._bodies_by_id = {body_id: body for body, body_id in ids.items()}
+
+        for client in list(self.clients.values()):
+            if client.outbuf:
+                # 이전 프레임도 다 못 보냄: 이번 건 건너뛰고 다음 델타에 합침
+                client.frames_coalesced += 1
+                continue
+            if client.known is None:
+                message = encode_frame(KEYFRAME, snapshot.step, list(records.values()))
+            else:
+                known = client.known
+                changed = [record for body_id, record in records.items() if known.get(body_id) != record]
+                removed = [body_id for body_id in known if body_id not in records]
+                if not changed and not removed:
+                    continue
+                message = encode_frame(DELTA, snapshot.step, changed, removed)
+            client.known = records
+            client.outbuf += message
+            client.frames_sent += 1
+            self._flush(client)
+
+    def _accept(self):
+        sock, _ = self.listener.accept()
+        sock.setblocking(False)
+        client = ClientConnection(sock)
+        self.clients[sock.fileno()] = client
+        self.selector.register(sock, selectors.EVENT_READ, client)
+
+    def _drop(self, client):
+        self.clients.pop(client.sock.fileno(), None)
+        try:
+            self.selector.unregister(client.sock)
+        except (KeyError, ValueError):
+            pass
+        client.sock.close()
+
+    def _read(self, client):
+        try:
+            data = client.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+        client.inbuf += data
+        for payload in split_messages(client.inbuf):
+            try:
+                self._handle_command(json.loads(payload))
+            except (ValueError, KeyError, TypeError, OverflowError):
+                pass  # 잘못된 명령은 무시
+
+    def _flush(self, client):
+        if client.outbuf:
+            try:
+                sent = client.sock.send(client.outbuf)
+                del client.outbuf[:sent]
+            except (BlockingIOError, InterruptedError):
+                pass
+            except OSError:
+                self._drop(client)
+                return
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.outbuf else 0)
+        self.selector.modify(client.sock, events, client)
+
+    def _handle_command(self, message):
+        """클라이언트 명령을 검사해서 물리 스레드 명령 큐로 넘김
+
+        값이 잘못되면 ValueError/KeyError/TypeError를 내고, 호출한 쪽에서 무시한다.
+        """
+        cmd = message["cmd"]
+        if cmd == "add":
+            color = _color(message.get("color", (0, 0, 255)))
+            radius = _finite(message.get("radius", 20))
+            mass = _finite(message.get("mass", 2.0))
+            if not 0 < radius <= min(WORLD_WIDTH, WORLD_HEIGHT) / 2:
+                raise ValueError(f"radius out of range: {radius}")
+            if mass <= 0:
+                raise ValueError(f"mass must be positive: {mass}")
+            # _cmd_drag처럼 월드 경계 안으로
+            x = max(radius, min(WORLD_WIDTH - radius, _finite(message["x"])))
+            y = max(radius, min(WORLD_HEIGHT - radius, _finite(message["y"])))
+            self.worker.send("add", GameObject(x, y, radius, color, mass=mass))
+            return
+        body = self._bodies_by_id.get(message.get("id"))
+        if body is None:
+            return
+        if cmd in ("remove", "toggle_static", "toggle_gravity"):
+            self.worker.send(cmd, body)
+        elif cmd == "drag":
+            self.worker.send("drag", body, _finite(message["x"]), _finite(message["y"]))
+        elif cmd == "mass":
+            self.worker.send("mass", body, _finite(message["delta"]))
+        elif cmd == "set_force":
+            self.worker.send("set_force", body, _finite(message["fx"]), _finite(message["fy"]))
+
+
+# --- 클라이언트 (뷰어, 스크립트 공용) ---
+class SimulationClient:
+    """서버에 붙어서 프레임을 받아 bodies를 최신 상태로 유지하고 명령을 보냄
+
+    bodies: {id: (x, y, 반지름, 색, 정지 여부)}
+    예) client.send("set_force", id=3, fx=0, fy=500)  # (X) 키와 같은 조작
+    """
+
+    def __init__(self, address=(DEFAULT_HOST, DEFAULT_PORT)):
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(address)
+        self.sock.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.sock, selectors.EVENT_READ)
+        self.buffer = bytearray()
+        self.bodies = {}
+        self.step = 0
+        self.frames_received = 0
+        self.connected = True
+
+    def poll(self, timeout=0.0):
+        """받은 프레임을 모두 적용하고 적용한 프레임 수를 돌려줌"""
+        if not self.connected:
+            return 0
+        while self.selector.select(timeout):
+            timeout = 0.0  # 처음 한 번만 기다리고 나머지는 쌓인 것만 읽음
+            try:
+                data = self.sock.recv(1 << 20)
+            except (BlockingIOError, InterruptedError):
+                break
+            if not data:
+                self.connected = False
+                break
+            self.buffer += data
+        applied = 0
+        for payload in split_messages(self.buffer):
+            kind, step, bodies, removed = decode_frame(payload)
+            if kind == KEYFRAME:
+                self.bodies = bodies
+            else:
+                self.bodies.update(bodies)
+                for body_id in removed:
+                    self.bodies.pop(body_id, None)
+            self.step = step
+            applied += 1
+        self.frames_received += applied
+        return applied
+
+    def send(self, cmd, **args):
+        self.sock.setblocking(True)
+        try:
+            self.sock.sendall(encode_command(cmd, **args))
+        finally:
+            self.sock.setblocking(False)
+
+    def close(self):
+        self.selector.close()
+        self.sock.close()
+        self.connected = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SIMUALTOR 시뮬레이션 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", default=None, help="TCP 대신 이 경로의 유닉스 소켓 사용")
+    parser.add_argument("--rate", type=float, default=30, help="초당 보내는 프레임 수")
+    parser.add_argument("--bodies", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--level", default=None, help="정적 지형 레벨 파일")
+    args = parser.parse_args()
+
+    level = load_level(args.level) if args.level else None
+    batch = spawn_bodies(args.bodies, (0, 0, WORLD_WIDTH, WORLD_HEIGHT), radius=(8, 15), seed=args.seed, level=level)
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 0), (128, 0, 128), (255, 165, 0)]
+    objects = [GameObject(x, y, r, colors[i % len(colors)], mass=m)
+               for i, (x, y, r, m) in enumerate(zip(batch.x.tolist(), batch.y.tolist(),
+                                                    batch.radius.tolist(), batch.mass.tolist()))]
+    worker = PhysicsWorker(objects, level=level)
+    worker.start()
+
+    server = SimulationServer(worker, args.unix or (args.host, args.port), args.rate)
+    print(f"서버 시작: {server.address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        worker.stop()
+        worker.join()
+
+
+if __name__ == "__main__":
+    main()
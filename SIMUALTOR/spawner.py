@@ -0,0 +1,143 @@
+import math
+from collections import namedtuple
+
+import numpy as np
+
+# 대량 생성 결과 (모두 같은 길이의 numpy 배열)
+SpawnBatch = namedtuple("SpawnBatch", "x y radius mass")
+
+
+def _sample(rng, spec, size):
+    """숫자면 그 값으로 고정, (최소, 최대)면 균등분포에서 뽑기"""
+    if np.isscalar(spec):
+        return np.full(size, float(spec))
+    low, high = spec
+    return rng.uniform(low, high, size)
+
+
+def _bounds(spec):
+    if np.isscalar(spec):
+        return float(spec), float(spec)
+    return float(spec[0]), float(spec[1])
+
+
+def spawn_bodies(count, region, radius=(15, 40), mass=(0.5, 5.0), seed=None,
+                 existing=None, level=None, max_failed_rounds=50):
+    """region=(x0, y0, x1, y1) 안에 서로 겹치지 않는 원 count개를 배치
+
+    격자 가속 거절 샘플링(Bridson 방식의 배경 격자)을 벡터화해서 돌린다.
+    격자 한 칸의 대각선이 가장 작은 지름과 같아서 한 칸에는 원이 최대 하나만
+    들어가고, 겹침 검사는 주변 (2k+1)² 칸만 보면 된다. 한 라운드의 후보들은
+    서로 k칸보다 멀리 떨어진 칸(같은 phase)에서만 뽑기 때문에 같은 라운드
+    안에서는 서로 충돌할 수 없어 후보 전체를 한 번에 검사할 수 있다.
+
+    existing=(x, y, radius) 배열을 주면 이미 있는 원과도 겹치지 않게 한다
+    (직접 비교하므로 화면에 있는 정도의 적은 수를 가정).
+    level(StaticLevel)을 주면 선분에 걸치거나 중심이 다각형 안에 있는 후보를 버린다.
+    같은 seed면 항상 같은 배치를 돌려준다. 공간이 모자라면 ValueError.
+    """
+    rng = np.random.default_rng(seed)
+    x0, y0, x1, y1 = (float(v) for v in region)
+    r_min, r_max = _bounds(radius)
+    if count <= 0:
+        empty = np.zeros(0)
+        return SpawnBatch(empty, empty.copy(), empty.copy(), empty.copy())
+    if r_min <= 0:
+        raise ValueError("radius must be positive")
+    if x1 - x0 < 2 * r_max or y1 - y0 < 2 * r_max:
+        raise ValueError("region is smaller than one body")
+
+    # 격자 크기: 칸 대각선 = 최소 지름 -> 칸당 원 하나
+    cell = math.sqrt(2) * r_min
+    reach = int(math.ceil(2 * r_max / cell))  # 검사해야 하는 이웃 칸 거리
+    period = reach + 1  # phase 간격 (같은 phase 후보끼리는 겹칠 수 없음)
+    cols = int(math.ceil((x1 - x0) / cell))
+    rows = int(math.ceil((y1 - y0) / cell))
+
+    # 가장자리 검사를 없애려고 reach만큼 -1로 패딩한 격자 (값 = 배치된 원 번호)
+    grid = np.full((rows + 2 * reach, cols + 2 * reach), -1, dtype=np.int64)
+    xs = np.empty(count)
+    ys = np.empty(count)
+    rs = np.empty(count)
+    placed = 0
+
+    if existing is not None:
+        ex, ey, er = (np.asarray(a, dtype=float) for a in existing)
+    else:
+        ex = ey = er = np.zeros(0)
+
+    offsets = np.arange(-reach, reach + 1)
+    off_y, off_x = (a.ravel() for a in np.meshgrid(offsets, offsets, indexing="ij"))
+
+    failed_rounds = 0
+    phase = 0
+    while placed < count:
+        # 이번 라운드의 phase에 속하는 칸들 중에서 후보 칸 고르기
+        px, py = phase % period, (phase // period) % period
+        phase += 1
+        phase_cols = np.arange(px, cols, period)
+        phase_rows = np.arange(py, rows, period)
+        slots = len(phase_cols) * len(phase_rows)
+        if slots == 0:
+            failed_rounds += 1
+            if failed_rounds >= max_failed_rounds:
+                break
+            continue
+        batch = min(slots, max(1024, 2 * (count - placed)))
+        pick = rng.choice(slots, size=batch, replace=False) if batch < slots else rng.permutation(slots)
+        cy = phase_rows[pick // len(phase_cols)]
+        cx = phase_cols[pick % len(phase_cols)]
+
+        # 칸 안에서 균등하게 위치, 반지름은 분포에서
+        cand_x = x0 + (cx + rng.random(len(pick))) * cell
+        cand_y = y0 + (cy + rng.random(len(pick))) * cell
+        cand_r = _sample(rng, radius, len(pick))
+
+        ok = ((cand_x - cand_r >= x0) & (cand_x + cand_r <= x1)
+              & (cand_y - cand_r >= y0) & (cand_y + cand_r <= y1)
+              & (grid[cy + reach, cx + reach] < 0))
+
+        # 이미 배치된 원과의 겹침 검사 (주변 칸만)
+        for dy, dx in zip(off_y, off_x):
+            neighbor = grid[cy + reach + dy, cx + reach + dx]
+            has = ok & (neighbor >= 0)
+            if not has.any():
+                continue
+            n = neighbor[has]
+            ddx = xs[n] - cand_x[has]
+            ddy = ys[n] - cand_y[has]
+            limit = rs[n] + cand_r[has]
+            ok[has] = ddx * ddx + ddy * ddy >= limit * limit
+
+        # 기존 원과의 겹침 검사
+        if len(ex) and ok.any():
+            idx = np.flatnonzero(ok)
+            ddx = cand_x[idx, None] - ex[None, :]
+            ddy = cand_y[idx, None] - ey[None, :]
+            limit = cand_r[idx, None] + er[None, :]
+            ok[idx] = ((ddx * ddx + ddy * ddy) >= limit * limit).all(axis=1)
+
+        # 정적 지형과의 겹침 검사
+        if level is not None and ok.any():
+            idx = np.flatnonzero(ok)
+            ok[idx] = ~level.blocked(cand_x[idx], cand_y[idx], cand_r[idx])
+
+        accepted = np.flatnonzero(ok)[:count - placed]
+        if len(accepted) == 0:
+            failed_rounds += 1
+            if failed_rounds >= max_failed_rounds:
+                break
+            continue
+        failed_rounds = 0
+
+        end = placed + len(accepted)
+        xs[placed:end] = cand_x[accepted]
+        ys[placed:end] = cand_y[accepted]
+        rs[placed:end] = cand_r[accepted]
+        grid[cy[accepted] + reach, cx[accepted] + reach] = np.arange(placed, end)
+        placed = end
+
+    if placed < count:
+        raise ValueError(f"region only fits about {placed} of {count} bodies")
+
+    return SpawnBatch(xs, ys, rs, _sample(rng, mass, count))
@@ -0,0 +1,129 @@
+from collections import namedtuple
+
+import numpy as np
+
+# 링 버퍼 열 순서
+COLUMNS = ("step", "kinetic_energy", "momentum_x", "momentum_y", "external_work",
+           "external_impulse_x", "external_impulse_y")
+(STEP, KINETIC_ENERGY, MOMENTUM_X, MOMENTUM_Y, EXTERNAL_WORK,
+ EXTERNAL_IMPULSE_X, EXTERNAL_IMPULSE_Y) = range(len(COLUMNS))
+
+
+def arrays_from_objects(objects, extra_force_y=0.0):
+    """GameObject 리스트에서 (질량, vx, vy, fx, fy) 배열을 뽑아냄
+
+    extra_force_y는 질량당 추가 힘(예: 전체 중력 가속도)으로, 외력 일에 포함된다.
+    정적 객체(질량 무한대)는 빼고 돌려준다.
+    """
+    count = len(objects)
+    values = np.fromiter(
+        (v for obj in objects for v in (obj.mass, obj.velocity.x, obj.velocity.y,
+                                        obj.external_force.x, obj.external_force.y)),
+        dtype=float, count=count * 5,
+    ).reshape(count, 5)
+    values = values[np.isfinite(values[:, 0])]
+    mass, vx, vy, fx, fy = values.T
+    return mass, vx, vy, fx, fy + mass * extra_force_y
+
+
+def export_rows(rows, path):
+    """히스토리 배열을 .npy 또는 .csv로 저장 (확장자로 구분)"""
+    if str(path).endswith(".npy"):
+        np.save(path, rows)
+    else:
+        np.savetxt(path, rows, fmt="%.10g", delimiter=",", header=",".join(COLUMNS), comments="")
+
+
+# 다른 스레드에 넘겨도 되는 한 시점의 기록 (history는 읽기 전용 사본)
+TelemetryState = namedtuple("TelemetryState",
+                            "history energy_drift momentum_drift energy_drift_flag momentum_drift_flag")
+
+
+class ConservationTelemetry:
+    """매 스텝 에너지/운동량 합계를 고정 크기 링 버퍼에 쌓는 기록기
+
+    스텝마다 하는 일은 배열 몇 개의 합뿐이고, 외력이 한 일과 외부 충격량은
+    누적값만 들고 있어서 기록 비용이 히스토리 길이와 상관없다. 기준점
+    (reset_reference) 이후 운동에너지 변화가 외력이 한 일과, 운동량 변화가
+    외부 충격량(외력 + 벽/지형/정적 객체에서 튕긴 것)과 drift_threshold 이상
+    어긋나면 각각 energy_drift_flag, momentum_drift_flag가 켜진다.
+    객체를 추가/삭제/드래그하면 기준점을 다시 잡아야 한다.
+    """
+
+    def __init__(self, capacity=600, drift_threshold=0.05):
+        self.capacity = capacity
+        self.drift_threshold = drift_threshold
+        self._buffer = np.zeros((capacity, len(COLUMNS)))
+        self._count = 0  # 지금까지 기록한 총 스텝 수
+        self.external_work = 0.0  # 기록 시작 이후 외력이 한 일의 누적값
+        self.external_impulse_x = 0.0  # 기록 시작 이후 외부에서 받은 충격량의 누적값
+        self.external_impulse_y = 0.0
+        self._reference = None  # (운동에너지, 운동량 x, 운동량 y, 외력 일, 충격량 x, 충격량 y) 기준점
+        self.energy_drift = 0.0
+        self.momentum_drift = 0.0
+        self.energy_drift_flag = False
+        self.momentum_drift_flag = False
+
+    def reset_reference(self):
+        """다음 기록을 보존량 비교의 새 기준점으로 삼음"""
+        self._reference = None
+
+    def record(self, step, mass, vx, vy, fx, fy, dt, boundary_impulse=(0.0, 0.0)):
+        """한 스텝의 합계를 기록 (boundary_impulse: 이번 스텝에 벽/지형/정적 객체가 준 충격량)"""
+        kinetic_energy = 0.5 * np.dot(mass, vx * vx + vy * vy)
+        momentum_x = np.dot(mass, vx)
+        momentum_y = np.dot(mass, vy)
+        self.external_work += (np.dot(fx, vx) + np.dot(fy, vy)) * dt
+        self.external_impulse_x += fx.sum() * dt + boundary_impulse[0]
+        self.external_impulse_y += fy.sum() * dt + boundary_impulse[1]
+
+        self._buffer[self._count % self.capacity] = (
+            step, kinetic_energy, momentum_x, momentum_y, self.external_work,
+            self.external_impulse_x, self.external_impulse_y)
+        self._count += 1
+
+        if self._reference is None:
+            self._reference = (kinetic_energy, momentum_x, momentum_y, self.external_work,
+                               self.external_impulse_x, self.external_impulse_y)
+        ref_energy, ref_px, ref_py, ref_work, ref_jx, ref_jy = self._reference
+
+        # 에너지: ΔKE = 외력이 한 일 이어야 함 (충돌/벽/감쇠 손실이 여기서 드러남)
+        residual = (kinetic_energy - ref_energy) - (self.external_work - ref_work)
+        energy_scale = max(ref_energy, kinetic_energy, abs(self.external_work - ref_work), 1e-9)
+        self.energy_drift = residual / energy_scale
+        # 운동량: Δp = 외부 충격량 이어야 함 (남는 차이를 전체 운동량 크기로 나눔)
+        residual_x = (momentum_x - ref_px) - (self.external_impulse_x - ref_jx)
+        residual_y = (momentum_y - ref_py) - (self.external_impulse_y - ref_jy)
+        momentum_scale = max(np.dot(mass, np.hypot(vx, vy)), 1e-9)
+        self.momentum_drift = np.hypot(residual_x, residual_y) / momentum_scale
+
+        self.energy_drift_flag = abs(self.energy_drift) > self.drift_threshold
+        self.momentum_drift_flag = self.momentum_drift > self.drift_threshold
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def history(self, column=None):
+        """오래된 것부터 순서대로 정렬한 히스토리 사본"""
+        if self._count <= self.capacity:
+            rows = self._buffer[:self._count].copy()
+        else:
+            start = self._count % self.capacity
+            rows = np.concatenate((self._buffer[start:], self._buffer[:start]))
+        return rows if column is None else rows[:, column]
+
+    def latest(self):
+        if self._count == 0:
+            return None
+        return self._buffer[(self._count - 1) % self.capacity].copy()
+
+    def state(self):
+        """지금까지의 히스토리와 드리프트 값을 바뀌지 않는 TelemetryState로 묶음"""
+        rows = self.history()
+        rows.flags.writeable = False
+        return TelemetryState(rows, float(self.energy_drift), float(self.momentum_drift),
+                              bool(self.energy_drift_flag), bool(self.momentum_drift_flag))
+
+    def export(self, path):
+        """히스토리를 .npy 또는 .csv로 저장 (확장자로 구분)"""
+        export_rows(self.history(), path)
@@ -0,0 +1,142 @@
+import math
+import sys
+
+import pygame
+
+from camera import Camera
+from server import DEFAULT_HOST, DEFAULT_PORT, SimulationClient
+from world import WORLD_WIDTH, WORLD_HEIGHT
+
+# --- 상수 ---
+SCREEN_WIDTH = 1200
+SCREEN_HEIGHT = 800
+VIEW_HEIGHT = SCREEN_HEIGHT - 100
+FPS = 60
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (200, 200, 200)
+LIGHT_BLUE = (173, 216, 230)
+BLUE = (0, 0, 255)
+
+# --- 서버 연결 (python viewer.py [호스트 포트 | 유닉스 소켓 경로]) ---
+if len(sys.argv) == 2:
+    address = sys.argv[1]
+elif len(sys.argv) >= 3:
+    address = (sys.argv[1], int(sys.argv[2]))
+else:
+    address = (DEFAULT_HOST, DEFAULT_PORT)
+client = SimulationClient(address)
+
+# --- Pygame 초기화 ---
+pygame.init()
+screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+pygame.display.set_caption("Physics Simulator Viewer")
+clock = pygame.time.Clock()
+
+try:
+    small_font = pygame.font.Font("Pretendard-Regular.otf", 16)
+except:
+    small_font = pygame.font.Font(None, 20)
+
+def draw_text(text, position, surface, color=BLACK):
+    surface.blit(small_font.render(text, True, color), position)
+
+def pick_body(wx, wy):
+    """월드 좌표 (wx, wy)에 있는 원의 id (가장 나중에 생긴 것 우선)"""
+    for body_id in sorted(client.bodies, reverse=True):
+        x, y, radius, _, _ = client.bodies[body_id]
+        if math.hypot(x - wx, y - wy) < radius:
+            return body_id
+    return None
+
+# --- 뷰어 변수 ---
+camera = Camera(SCREEN_WIDTH, VIEW_HEIGHT)
+camera.fit(WORLD_WIDTH, WORLD_HEIGHT)
+selected_id = None
+dragging = False
+panning = False
+
+# --- 메인 루프 ---
+running = True
+while running and client.connected:
+    clock.tick(FPS)
+    client.poll()
+
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            running = False
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                running = False
+            if event.key == pygame.K_HOME:
+                camera.fit(WORLD_WIDTH, WORLD_HEIGHT)
+            if event.key == pygame.K_c:  # 화면 가운데에 원 추가
+                x, y = camera.screen_to_world(SCREEN_WIDTH / 2, VIEW_HEIGHT / 2)
+                client.send("add", x=x, y=y, radius=20, mass=2.0)
+            if selected_id is not None:
+                if event.key in (pygame.K_DELETE, pygame.K_BACKSPACE):
+                    client.send("remove", id=selected_id)
+                    selected_id = None
+                elif event.key == pygame.K_s:
+                    client.send("toggle_static", id=selected_id)
+                elif event.key == pygame.K_v:
+                    client.send("toggle_gravity", id=selected_id)
+                elif event.key == pygame.K_UP:
+                    client.send("mass", id=selected_id, delta=0.5)
+                elif event.key == pygame.K_DOWN:
+                    client.send("mass", id=selected_id, delta=-0.5)
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1 and event.pos[1] < VIEW_HEIGHT:
+                selected_id = pick_body(*camera.screen_to_world(*event.pos))
+                dragging = selected_id is not None
+            if event.button == 3:
+                panning = True
+
+        if event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:
+                dragging = False
+            if event.button == 3:
+                panning = False
+
+        if event.type == pygame.MOUSEWHEEL:
+            camera.zoom_at(*pygame.mouse.get_pos(), 1.1 ** event.y)
+
+        if event.type == pygame.MOUSEMOTION:
+            if panning:
+                camera.pan(*event.rel)
+            if dragging and selected_id is not None:
+                x, y = camera.screen_to_world(*event.pos)
+                client.send("drag", id=selected_id, x=x, y=y)
+
+    # --- 그리기 ---
+    screen.fill(WHITE)
+    x0, y0, x1, y1 = camera.visible_rect()
+    for body_id, (x, y, radius, color, is_static) in client.bodies.items():
+        if x + radius < x0 or x - radius > x1 or y + radius < y0 or y - radius > y1:
+            continue
+        sx, sy = camera.world_to_screen(x, y)
+        size = max(1, int(radius * camera.zoom))
+        pygame.draw.circle(screen, color, (int(sx), int(sy)), size)
+        if body_id == selected_id:
+            pygame.draw.circle(screen, LIGHT_BLUE, (int(sx), int(sy)), size + 3, 3)
+
+    left, top = camera.world_to_screen(0, 0)
+    right, bottom = camera.world_to_screen(WORLD_WIDTH, WORLD_HEIGHT)
+    pygame.draw.rect(screen, BLACK, (int(left), int(top), int(right - left), int(bottom - top)), 1)
+
+    # --- UI ---
+    pygame.draw.rect(screen, GRAY, (0, VIEW_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT - VIEW_HEIGHT))
+    draw_text("(C)원 추가 | (DEL)삭제 | (S)정지/움직임 토글 | (V)개별 중력 토글 | (↑/↓)질량",
+              (10, VIEW_HEIGHT + 5), screen)
+    draw_text("클릭: 선택 | 드래그: 이동 | 오른쪽 드래그: 화면 이동 | 휠: 확대/축소 | (HOME)전체 보기",
+              (10, VIEW_HEIGHT + 25), screen)
+    draw_text(f"서버: {address} | 스텝: {client.step} | 받은 프레임: {client.frames_received} | 객체 수: {len(client.bodies)}",
+              (10, VIEW_HEIGHT + 45), screen)
+
+    pygame.display.flip()
+
+client.close()
+pygame.quit()
@@ -0,0 +1,295 @@
+import math
+import queue
+import random
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+import pygame
+
+from camera import SpatialGrid
+from telemetry import ConservationTelemetry, arrays_from_objects
+
+# --- 상수 ---
+WORLD_WIDTH = 4000  # 월드 크기 (창 크기와 무관)
+WORLD_HEIGHT = 3000
+PHYSICS_HZ = 120  # 물리 스레드의 고정 스텝 주기
+
+# --- 게임 객체 클래스 ---
+class GameObject:
+    def __init__(self, x, y, radius, color, mass=1.0, is_static=False):
+        self.pos = pygame.math.Vector2(x, y)
+        self.radius = radius
+        self.color = color
+        self.mass = mass if not is_static else float('inf')
+        self.is_static = is_static
+        self.velocity = pygame.math.Vector2(0, 0)
+        self.external_force = pygame.math.Vector2(0, 0)
+
+    def apply_force(self, force_vector):
+        if not self.is_static:
+            acceleration = force_vector / self.mass
+            self.velocity += acceleration
+
+    def check_collision(self, other):
+        """다른 객체와의 충돌 검사"""
+        if self == other or (self.is_static and other.is_static):
+            return False
+
+        distance = self.pos.distance_to(other.pos)
+        return distance < (self.radius + other.radius)
+
+    def resolve_collision(self, other, impulse=None):
+        """impulse: [x, y] 리스트를 주면 정적 객체가 움직이는 객체에 준 충격량을 더함"""
+        if self.is_static and other.is_static:
+            return
+
+        # 두 공의 중심 사이의 거리와 방향 계산 (피타고라스 정리 사용)
+        dx = other.pos.x - self.pos.x  # x축 거리차
+        dy = other.pos.y - self.pos.y  # y축 거리차
+        distance = math.sqrt(dx*dx + dy*dy)  # 직선거리 = √(dx² + dy²)
+
+        if distance == 0:
+            return
+
+        # 겹친 부분을 분리 (단순히 반반씩 밀어냄)
+        overlap = (self.radius + other.radius) - distance
+
+        # 방향을 단위벡터로 만들기 (전체 거리로 나누면 방향만 남음)
+        direction_x = dx / distance  # x방향 (-1 ~ 1 사이 값)
+        direction_y = dy / distance  # y방향 (-1 ~ 1 사이 값)
+
+        # 겹친 만큼 객체들을 분리
+        move_distance = overlap / 2
+        if not self.is_static:
+            self.pos.x -= direction_x * move_distance
+            self.pos.y -= direction_y * move_distance
+        if not other.is_static:
+            other.pos.x += direction_x * move_distance
+            other.pos.y += direction_y * move_distance
+
+        # 충돌 방향으로의 속도만 계산 (내적 대신 단순 곱셈과 덧셈)
+        # 각 공의 속도를 충돌 방향으로 투영
+        v1_collision = self.velocity.x * direction_x + self.velocity.y * direction_y
+        v2_collision = other.velocity.x * direction_x + other.velocity.y * direction_y
+
+        # 이미 분리되고 있으면 더이상 처리하지 않음
+        if v1_collision - v2_collision <= 0:
+            return
+
+        # 질량 처리 (정적 객체는 매우 무거운 것으로 처리)
+        if self.is_static:
+            m1 = 999999
+        else:
+            m1 = self.mass
+
+        if other.is_static:
+            m2 = 999999
+        else:
+            m2 = other.mass
+
+        # 완전 탄성 충돌 공식 (고등학교 물리 공식 그대로)
+        # 새로운 속도 = ((자신질량-상대질량) × 자신속도 + 2×상대질량×상대속도) ÷ (질량합)
+        new_v1_collision = ((m1 - m2) * v1_collision + 2 * m2 * v2_collision) / (m1 + m2)
+        new_v2_collision = ((m2 - m1) * v2_collision + 2 * m1 * v1_collision) / (m1 + m2)
+
+        # 속도 변화량 계산
+        v1_change = (new_v1_collision - v1_collision)
+        v2_change = (new_v2_collision - v2_collision)
+
+        # 정적 객체는 운동량 합계 밖에 있으므로 움직이는 쪽이 받은 충격량은 외부에서 온 것
+        if impulse is not None:
+            if self.is_static:
+                impulse[0] += other.mass * direction_x * v2_change
+                impulse[1] += other.mass * direction_y * v2_change
+            elif other.is_static:
+                impulse[0] += self.mass * direction_x * v1_change
+                impulse[1] += self.mass * direction_y * v1_change
+
+        # 충돌 방향으로만 속도 변경 (충돌과 수직인 방향은 그대로 유지)
+        if not self.is_static:
+            self.velocity.x += direction_x * v1_change
+            self.velocity.y += direction_y * v1_change
+        if not other.is_static:
+            other.velocity.x += direction_x * v2_change
+            other.velocity.y += direction_y * v2_change
+
+    def update(self, dt, impulse=None):
+        """impulse: [x, y] 리스트를 주면 월드 경계에서 튕길 때 받은 충격량을 더함"""
+        if not self.is_static:
+            # 외부 힘이 있으면 지속적으로 적용
+            if self.external_force.length_squared() > 0:
+                self.apply_force(self.external_force * dt)
+
+            self.pos += self.velocity * dt
+
+            # 객체를 월드 경계 내에 유지
+            if self.pos.x - self.radius < 0 or self.pos.x + self.radius > WORLD_WIDTH:
+                if impulse is not None:
+                    impulse[0] -= 2 * self.mass * self.velocity.x
+                self.velocity.x *= -1  # 에너지 손실과 함께 반사
+                self.pos.x = max(self.radius, min(WORLD_WIDTH - self.radius, self.pos.x))
+
+            if self.pos.y - self.radius < 0:
+                if impulse is not None:
+                    impulse[1] -= 2 * self.mass * self.velocity.y
+                self.velocity.y *= -1
+                self.pos.y = self.radius
+
+            if self.pos.y + self.radius > WORLD_HEIGHT:
+                if impulse is not None:
+                    impulse[1] -= 2 * self.mass * self.velocity.y
+                self.velocity.y *= -1
+                self.pos.y = WORLD_HEIGHT - self.radius
+
+
+def step_world(objects, dt, level=None, impulse=None):
+    """모든 객체를 dt만큼 진행시키고 충돌을 처리 (level: 정적 지형 StaticLevel)
+
+    impulse: [x, y] 리스트를 주면 벽, 지형, 정적 객체가 준 충격량(외부 운동량 전달)을 더함
+    """
+    # 모든 객체 업데이트
+    for obj in objects:
+        obj.update(dt, impulse)
+
+    # 정적 지형과의 충돌 (BVH로 근처 선분만 검사)
+    if level is not None:
+        for obj in objects:
+            if not obj.is_static:
+                level.collide(obj, impulse=impulse)
+
+    # 모든 객체 간 충돌 검사
+    for i in range(len(objects)):
+        for j in range(i + 1, len(objects)):
+            obj1 = objects[i]
+            obj2 = objects[j]
+            if obj1.check_collision(obj2):
+                obj1.resolve_collision(obj2, impulse)
+
+
+# --- 렌더러에 넘겨주는 상태 스냅샷 ---
+# body는 명령을 보낼 때 쓰는 핸들일 뿐, 렌더 스레드에서 그 필드를 직접 읽으면 안 된다.
+BodyState = namedtuple("BodyState", "body x y radius color mass is_static vx vy fx fy")
+# grid는 렌더러가 보이는 원만 골라 그릴 때 쓰는 공간 인덱스 (물리 스레드가 미리 만들어 둠)
+# index는 body 핸들 -> bodies 안의 위치 (선택된 객체를 매 프레임 훑지 않고 바로 찾음)
+# telemetry는 같은 스텝의 보존량 기록 (TelemetryState, 기록기가 없으면 None)
+WorldSnapshot = namedtuple("WorldSnapshot", "step bodies grid max_radius index telemetry")
+
+
+def take_snapshot(objects, step, telemetry=None):
+    bodies = tuple(
+        BodyState(obj, obj.pos.x, obj.pos.y, obj.radius, obj.color, obj.mass, obj.is_static,
+                  obj.velocity.x, obj.velocity.y, obj.external_force.x, obj.external_force.y)
+        for obj in objects
+    )
+    xs = np.fromiter((b.x for b in bodies), dtype=float, count=len(bodies))
+    ys = np.fromiter((b.y for b in bodies), dtype=float, count=len(bodies))
+    max_radius = max((b.radius for b in bodies), default=0)
+    index = {obj: i for i, obj in enumerate(objects)}
+    return WorldSnapshot(step, bodies, SpatialGrid(xs, ys, WORLD_WIDTH, WORLD_HEIGHT), max_radius, index,
+                         telemetry.state() if telemetry is not None else None)
+
+
+# --- 물리 워커 스레드 ---
+class PhysicsWorker(threading.Thread):
+    """물리 스텝을 전용 스레드에서 고정 주기로 돌리는 워커
+
+    객체 리스트는 이 스레드만 수정한다. 입력은 send()로 명령 큐에 넣고,
+    렌더 루프는 snapshot 속성으로 가장 최근 상태를 잠금 없이 읽는다.
+    스냅샷은 뒤쪽 버퍼에서 완성한 뒤 참조 하나만 바꿔 끼워 공개하므로
+    (GIL 하에서 원자적) 렌더러가 반쯤 갱신된 상태를 보는 일은 없다.
+    """
+
+    def __init__(self, objects=None, hz=PHYSICS_HZ, level=None):
+        super().__init__(daemon=True)
+        self.objects = objects if objects is not None else []
+        self.level = level
+        self.dt = 1.0 / hz
+        self.commands = queue.SimpleQueue()
+        self.telemetry = ConservationTelemetry()  # 물리 스레드 전용, 렌더러는 snapshot.telemetry를 읽음
+        self.snapshot = take_snapshot(self.objects, 0, self.telemetry)  # 앞쪽 버퍼
+        self.step_count = 0
+        self.last_step_time = 0.0  # 마지막 스텝에 걸린 시간 (초)
+        self._stop_event = threading.Event()
+
+    def send(self, name, *args):
+        """물리 스레드에 명령을 넣는다 (렌더 스레드에서 호출)"""
+        self.commands.put((name, args))
+
+    def stop(self):
+        self._stop_event.set()
+
+    def run(self):
+        next_tick = time.perf_counter()
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            self._drain_commands()
+            impulse = [0.0, 0.0]
+            step_world(self.objects, self.dt, self.level, impulse)
+            self.step_count += 1
+            self.telemetry.record(self.step_count, *arrays_from_objects(self.objects), self.dt, impulse)
+            back = take_snapshot(self.objects, self.step_count, self.telemetry)
+            self.snapshot = back  # 앞/뒤 버퍼 교체
+            self.last_step_time = time.perf_counter() - started
+
+            # 다음 틱까지 대기 (밀렸으면 바로 다음 스텝)
+            next_tick += self.dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                next_tick = time.perf_counter()
+
+    def _drain_commands(self):
+        while True:
+            try:
+                name, args = self.commands.get_nowait()
+            except queue.Empty:
+                return
+            handler = getattr(self, "_cmd_" + name, None)
+            if handler is not None:
+                handler(*args)
+                self.telemetry.reset_reference()  # 사용자가 상태를 바꿨으니 보존량 기준점을 다시 잡음
+
+    # --- 명령 처리 (물리 스레드에서만 실행) ---
+    def _cmd_add(self, obj):
+        self.objects.append(obj)
+
+    def _cmd_add_many(self, objs):
+        self.objects.extend(objs)
+
+    def _cmd_remove(self, obj):
+        if obj in self.objects:
+            self.objects.remove(obj)
+
+    def _cmd_drag(self, obj, x, y):
+        if obj not in self.objects:
+            return
+        obj.pos = pygame.math.Vector2(x, y)
+        # 드래그된 객체를 월드 경계 내에 유지
+        obj.pos.x = max(obj.radius, min(WORLD_WIDTH - obj.radius, obj.pos.x))
+        obj.pos.y = max(obj.radius, min(WORLD_HEIGHT - obj.radius, obj.pos.y))
+        if not obj.is_static:
+            obj.velocity = pygame.math.Vector2(0, 0)
+
+    def _cmd_toggle_static(self, obj):
+        obj.is_static = not obj.is_static
+        obj.mass = float('inf') if obj.is_static else random.uniform(1.0, 5.0)
+        obj.velocity = pygame.math.Vector2(0, 0)
+
+    def _cmd_mass(self, obj, delta):
+        if obj.is_static:
+            return
+        if delta < 0 and obj.mass <= 0.5:
+            return
+        obj.mass = round(obj.mass + delta, 1)
+
+    def _cmd_toggle_gravity(self, obj):
+        if obj.external_force.y > 0:
+            obj.external_force = pygame.math.Vector2(0, 0)
+        else:
+            obj.external_force = pygame.math.Vector2(0, 100*obj.mass)
+
+    def _cmd_set_force(self, obj, fx, fy):
+        obj.external_force = pygame.math.Vector2(fx, fy)
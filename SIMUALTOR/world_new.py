@@ -0,0 +1,211 @@
+"""Bodies and the simulation step used by main_new.py
+
+Kept free of any window setup so the step can be run (and measured) headless:
+
+    python world_new.py   # checks that per-step allocations stay flat as bodies grow
+"""
+import math
+import tracemalloc
+
+import pygame
+
+# --- Constants ---
+SCREEN_WIDTH = 1200
+SCREEN_HEIGHT = 800
+
+
+# --- GameObject Class ---
+class GameObject:
+    # Fixed attribute layout: no per-instance __dict__ to allocate or scan
+    __slots__ = ("pos", "radius", "color", "mass", "is_static", "velocity", "angle",
+                 "angular_velocity", "external_force", "selected")
+
+    def __init__(self, x, y, radius, color, mass=1.0, is_static=False):
+        self.pos = pygame.math.Vector2(x, y)
+        self.radius = radius
+        self.color = color
+        self.mass = mass if not is_static else float('inf')
+        self.is_static = is_static
+        self.velocity = pygame.math.Vector2(0, 0)
+        self.angle = 0  # Degrees
+        self.angular_velocity = 0  # Degrees per second
+        self.external_force = pygame.math.Vector2(0, 0)
+        self.selected = False
+
+    def apply_force(self, force_vector):
+        if not self.is_static:
+            acceleration = force_vector / self.mass
+            self.velocity += acceleration
+
+    def check_collision(self, other):
+        """Check collision with another object"""
+        if self == other or (self.is_static and other.is_static):
+            return False
+        
+        distance = self.pos.distance_to(other.pos)
+        return distance < (self.radius + other.radius)
+
+    def resolve_collision(self, other, impulse=None):
+        """Resolve collision with another object
+
+        impulse: optional [x, y] list; a static body's push on a moving one is added to it
+        """
+        if self.is_static and other.is_static:
+            return
+        
+        # Calculate collision vector (component-wise, so no temporary Vector2s)
+        dx = other.pos.x - self.pos.x
+        dy = other.pos.y - self.pos.y
+        distance = math.sqrt(dx * dx + dy * dy)
+        
+        if distance == 0:
+            return
+        
+        # Normalize collision vector
+        normal_x = dx / distance
+        normal_y = dy / distance
+        
+        # Separate objects
+        overlap = (self.radius + other.radius) - distance
+        separation = overlap / 2
+        
+        if not self.is_static:
+            self.pos.x -= normal_x * separation
+            self.pos.y -= normal_y * separation
+        if not other.is_static:
+            other.pos.x += normal_x * separation
+            other.pos.y += normal_y * separation
+        
+        # Calculate relative velocity along the normal
+        velocity_along_normal = ((other.velocity.x - self.velocity.x) * normal_x
+                                 + (other.velocity.y - self.velocity.y) * normal_y)
+        
+        # Don't resolve if velocities are separating
+        if velocity_along_normal > 0:
+            return
+        
+        # Calculate restitution (bounciness)
+        restitution = 0.8
+        
+        # Calculate impulse scalar
+        impulse_scalar = -(1 + restitution) * velocity_along_normal
+        impulse_scalar /= (1/self.mass + 1/other.mass) if not self.is_static and not other.is_static else 1
+        
+        # Static bodies are outside the momentum total, so their push counts as external
+        if impulse is not None and (self.is_static or other.is_static):
+            sign = 1 if self.is_static else -1
+            impulse[0] += sign * impulse_scalar * normal_x
+            impulse[1] += sign * impulse_scalar * normal_y
+
+        # Apply impulse
+        if not self.is_static:
+            self.velocity.x -= impulse_scalar * normal_x / self.mass
+            self.velocity.y -= impulse_scalar * normal_y / self.mass
+        if not other.is_static:
+            other.velocity.x += impulse_scalar * normal_x / other.mass
+            other.velocity.y += impulse_scalar * normal_y / other.mass
+
+    def update(self, dt, impulse=None):
+        """impulse: optional [x, y] list; momentum picked up bouncing off the bounds is added to it"""
+        if not self.is_static:
+            # Apply external force (if any) continuously
+            if self.external_force.length_squared() > 0:
+                self.velocity.x += self.external_force.x * dt / self.mass
+                self.velocity.y += self.external_force.y * dt / self.mass
+
+            # Apply simple damping to prevent infinite acceleration
+            self.velocity *= 0.999
+
+            self.pos.x += self.velocity.x * dt
+            self.pos.y += self.velocity.y * dt
+            self.angle = (self.angle + self.angular_velocity * dt) % 360
+            
+            # Keep objects within screen bounds
+            if self.pos.x - self.radius < 0 or self.pos.x + self.radius > SCREEN_WIDTH:
+                if impulse is not None:
+                    impulse[0] -= 1.8 * self.mass * self.velocity.x
+                self.velocity.x *= -0.8  # Bounce with energy loss
+                self.pos.x = max(self.radius, min(SCREEN_WIDTH - self.radius, self.pos.x))
+            
+            if self.pos.y - self.radius < 0:
+                if impulse is not None:
+                    impulse[1] -= 1.8 * self.mass * self.velocity.y
+                self.velocity.y *= -0.8
+                self.pos.y = self.radius
+            
+            if self.pos.y + self.radius > SCREEN_HEIGHT - 160:  # Account for UI area
+                if impulse is not None:
+                    impulse[1] -= 1.8 * self.mass * self.velocity.y
+                self.velocity.y *= -0.8
+                self.pos.y = SCREEN_HEIGHT - 160 - self.radius
+
+    def is_clicked(self, mouse_pos):
+        return self.pos.distance_to(mouse_pos) < self.radius
+
+# --- Simulation Step ---
+def step_world(objects, dt, gravity_enabled, impulse=None):
+    """Advance all bodies by dt and resolve collisions
+
+    impulse: optional [x, y] list that collects the momentum handed to moving
+    bodies by the screen bounds and by static bodies.
+    """
+    # Apply global gravity if enabled (mass cancels out: a = g)
+    if gravity_enabled:
+        for obj in objects:
+            if not obj.is_static:
+                obj.velocity.y += 200 * dt
+    
+    # Update all objects
+    for obj in objects:
+        obj.update(dt, impulse)
+    
+    # Check collisions between all objects
+    count = len(objects)
+    for i, obj1 in enumerate(objects):
+        for j in range(i + 1, count):
+            obj2 = objects[j]
+            if obj1.check_collision(obj2):
+                obj1.resolve_collision(obj2, impulse)
+
+
+def build_allocation_scene(count):
+    """Fresh bodies on a grid with fixed velocities, so measuring never touches the live scene"""
+    columns = max(1, int(math.sqrt(count)))
+    objects = []
+    for i in range(count):
+        row, column = divmod(i, columns)
+        obj = GameObject(30 + (column % 37) * 30, 30 + (row % 21) * 30, 12, (0, 0, 0), mass=1.0 + i % 3)
+        obj.velocity.update(40 - 80 * (i % 2), 30 - 60 * (i % 3 == 0))
+        objects.append(obj)
+    return objects
+
+def measure_step_allocations(count, dt=1 / 60, gravity_enabled=False, steps=10):
+    """Step a throwaway scene of count bodies under tracemalloc and return (net_bytes, peak_bytes).
+
+    net_bytes is memory still held after the steps, peak_bytes the largest
+    transient growth while stepping. Both should stay flat as the body count
+    grows; anything proportional to count is a hot-path allocation.
+    """
+    objects = build_allocation_scene(count)
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start()
+    step_world(objects, dt, gravity_enabled)  # warm up caches outside the measurement
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for _ in range(steps):
+        step_world(objects, dt, gravity_enabled)
+    current, peak = tracemalloc.get_traced_memory()
+    if started_here:
+        tracemalloc.stop()
+    return current - base, peak - base
+
+if __name__ == "__main__":
+    # Flat means a few hundred bytes of interpreter noise at any size, not bytes per body
+    ALLOWED_GROWTH = 1024
+    small = measure_step_allocations(10, gravity_enabled=True)
+    large = measure_step_allocations(300, gravity_enabled=True)
+    print(f"10 bodies: net {small[0]} B, peak {small[1]} B")
+    print(f"300 bodies: net {large[0]} B, peak {large[1]} B")
+    assert large[0] - small[0] < ALLOWED_GROWTH, "net allocations grow with the body count"
+    assert large[1] - small[1] < ALLOWED_GROWTH, "peak allocations grow with the body count"
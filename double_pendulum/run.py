@@ -0,0 +1,134 @@
+import argparse
+import multiprocessing
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+G = 9.8
+M1, M2 = 1.0, 1.0
+L1, L2 = 1.0, 1.0
+
+PERTURBATION = 1e-8  # 이웃 궤도의 처음 거리 (위상공간)
+RENORM_EVERY = 10  # 이 스텝마다 이웃 궤도를 다시 PERTURBATION 거리로 당겨옴
+
+font_dict = {'fontname': 'Noto Sans KR', 'fontweight': 'bold'}
+
+
+def derivatives(state):
+    """이중 진자 운동방정식. state: (4, n) = 각1, 각2, 각속도1, 각속도2 (아래 방향이 0)"""
+    theta1, theta2, omega1, omega2 = state
+    delta = theta1 - theta2
+    sin_d, cos_d = np.sin(delta), np.cos(delta)
+    omega1_sq, omega2_sq = omega1 * omega1, omega2 * omega2
+    den = 2 * M1 + M2 - M2 * (2 * cos_d * cos_d - 1)  # cos(2Δ)를 cos(Δ)로 계산
+    alpha1 = (-G * (2 * M1 + M2) * np.sin(theta1)
+              - M2 * G * np.sin(theta1 - 2 * theta2)
+              - 2 * sin_d * M2 * (omega2_sq * L2 + omega1_sq * L1 * cos_d)) / (L1 * den)
+    alpha2 = (2 * sin_d * (omega1_sq * L1 * (M1 + M2)
+                           + G * (M1 + M2) * np.cos(theta1)
+                           + omega2_sq * L2 * M2 * cos_d)) / (L2 * den)
+    return np.stack((omega1, omega2, alpha1, alpha2))
+
+
+def rk4_step(state, dt):
+    """모든 초기조건을 한 번에 RK4로 dt만큼 진행"""
+    k1 = derivatives(state)
+    k2 = derivatives(state + dt / 2 * k1)
+    k3 = derivatives(state + dt / 2 * k2)
+    k4 = derivatives(state + dt * k3)
+    return state + dt / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
+def ftle_and_flip(theta1, theta2, total_time, dt):
+    """초기 각도 배열들에 대해 (유한시간 리아푸노프 지수, 처음 뒤집히는 시간)을 계산
+
+    기준 궤도와 PERTURBATION만큼 떨어진 이웃 궤도를 한 배열에 쌓아서 같이
+    적분하고, RENORM_EVERY 스텝마다 거리를 재서 로그를 더한 뒤 다시 당겨온다
+    (Benettin 방법). 뒤집힘은 어느 팔이든 각도가 ±π를 넘는 순간이고,
+    끝까지 안 뒤집히면 NaN.
+    """
+    n = theta1.size
+    reference = np.stack((theta1.ravel(), theta2.ravel(), np.zeros(n), np.zeros(n)))
+    neighbor = reference.copy()
+    neighbor[0] += PERTURBATION
+    state = np.concatenate((reference, neighbor), axis=1)  # (4, 2n): 한 번의 RK4로 둘 다 진행
+
+    log_stretch = np.zeros(n)
+    flip_time = np.full(n, np.nan)
+    steps = int(round(total_time / dt))
+    for step in range(1, steps + 1):
+        state = rk4_step(state, dt)
+
+        # 처음 뒤집힌 시간 기록 (기준 궤도만)
+        flipped = (np.abs(state[0, :n]) > np.pi) | (np.abs(state[1, :n]) > np.pi)
+        newly = flipped & np.isnan(flip_time)
+        flip_time[newly] = step * dt
+
+        if step % RENORM_EVERY == 0 or step == steps:
+            separation = state[:, n:] - state[:, :n]
+            distance = np.sqrt((separation * separation).sum(axis=0))
+            distance = np.maximum(distance, 1e-300)
+            log_stretch += np.log(distance / PERTURBATION)
+            state[:, n:] = state[:, :n] + separation * (PERTURBATION / distance)
+
+    ftle = log_stretch / (steps * dt)
+    return ftle.reshape(theta1.shape), flip_time.reshape(theta1.shape)
+
+
+def compute_rows(task):
+    """격자의 행 구간 하나 계산 (프로세스 풀 작업 단위)"""
+    row_start, row_stop, size, total_time, dt = task
+    # 칸 가운데를 샘플링 (±π 위의 점은 첫 스텝부터 뒤집힌 것으로 읽힘)
+    angles = np.linspace(-np.pi, np.pi, size, endpoint=False) + np.pi / size
+    theta1, theta2 = np.meshgrid(angles, angles[row_start:row_stop])  # 행: 각2, 열: 각1
+    ftle, flip_time = ftle_and_flip(theta1, theta2, total_time, dt)
+    return row_start, ftle, flip_time
+
+
+def compute_maps(size, total_time, dt, workers=None, chunk_rows=None):
+    """size × size 초기 각도 격자의 FTLE 지도와 뒤집힘 시간 지도를 여러 코어로 나눠 계산"""
+    if chunk_rows is None:
+        # 한 작업에 최대 약 2만 개 초기조건, 작은 격자도 코어마다 몇 개씩 돌아가게
+        cores = workers or multiprocessing.cpu_count()
+        chunk_rows = max(1, min(20000 // size, size // (4 * cores)))
+    tasks = [(start, min(start + chunk_rows, size), size, total_time, dt)
+             for start in range(0, size, chunk_rows)]
+    ftle = np.empty((size, size))
+    flip_time = np.empty((size, size))
+    with multiprocessing.Pool(workers) as pool:
+        for done, (start, ftle_rows, flip_rows) in enumerate(pool.imap_unordered(compute_rows, tasks), 1):
+            ftle[start:start + len(ftle_rows)] = ftle_rows
+            flip_time[start:start + len(flip_rows)] = flip_rows
+            print(f"\r{done}/{len(tasks)} 구간 완료", end="", flush=True)
+    print()
+    return ftle, flip_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이중 진자 카오스 지도 (FTLE, 뒤집힘 시간)")
+    parser.add_argument("--size", type=int, default=200, help="격자 한 변의 초기조건 수")
+    parser.add_argument("--time", type=float, default=20.0, help="적분 시간 (초)")
+    parser.add_argument("--dt", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=None, help="기본값: CPU 코어 수")
+    parser.add_argument("--output", default="double_pendulum.png")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    ftle, flip_time = compute_maps(args.size, args.time, args.dt, args.workers)
+    print(f"{args.size}x{args.size} 격자 계산: {time.perf_counter() - started:.1f}초")
+    np.savez(args.output.rsplit(".", 1)[0] + ".npz", ftle=ftle, flip_time=flip_time)
+
+    extent = (-180, 180, -180, 180)
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    image = ax1.imshow(ftle, origin="lower", extent=extent, cmap="magma")
+    ax1.set_title("유한시간 리아푸노프 지수", fontdict=font_dict)
+    fig.colorbar(image, ax=ax1)
+    image = ax2.imshow(np.log10(flip_time), origin="lower", extent=extent, cmap="viridis")
+    ax2.set_title("처음 뒤집히는 시간 (log10 초, 빈칸: 안 뒤집힘)", fontdict=font_dict)
+    fig.colorbar(image, ax=ax2)
+    for ax in (ax1, ax2):
+        ax.set_xlabel("각1 (도)", fontdict=font_dict)
+        ax.set_ylabel("각2 (도)", fontdict=font_dict)
+    plt.savefig(args.output, dpi=150)
+    plt.show()